@@ -12,7 +12,6 @@
 
 from .core import SpectralDevice, DeviceCapabilities, MeasurementResult
 from .gui import SpectralMeasurementGUI, PlotWindow
-from .devices import OSpRadDevice
 
 __version__ = "1.0.0"
 
@@ -24,3 +23,11 @@ __all__ = [
     'PlotWindow',
     'OSpRadDevice',
 ]
+
+
+def __getattr__(name):
+    """Device drivers are only imported when first accessed"""
+    if name == 'OSpRadDevice':
+        from .devices import OSpRadDevice
+        return OSpRadDevice
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,8 @@
 #  Portable, modular GUI framework for spectral measurement devices
 #
 
-from .device_interface import SpectralDevice, DeviceCapabilities
-from .measurement_result import MeasurementResult
+from .device_interface import SpectralDevice, DeviceCapabilities, MeasurementType, SettingDefinition
+from .measurement_result import MeasurementResult, RADIANCE_TYPES, IRRADIANCE_TYPES
 
-__all__ = ['SpectralDevice', 'DeviceCapabilities', 'MeasurementResult']
+__all__ = ['SpectralDevice', 'DeviceCapabilities', 'MeasurementType', 'SettingDefinition',
+           'MeasurementResult', 'RADIANCE_TYPES', 'IRRADIANCE_TYPES']
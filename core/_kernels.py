@@ -0,0 +1,55 @@
+#
+#  Numeric Kernels
+#
+#  Hot numeric loops shared by the core data types.
+#  Numba is optional: when installed, kernels are JIT-compiled to native
+#  code, otherwise equivalent numpy expressions are used.
+#
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _argmax_loop(values):
+    """
+    Index of the first maximum of values, without temporaries.
+    
+    Matches np.argmax: the first NaN, if any, counts as the maximum.
+    Kept as plain Python so both code paths can be tested without numba.
+    """
+    best = 0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v != v:
+            return i
+        if v > values[best]:
+            best = i
+    return best
+
+
+def _argmax_numpy(values: np.ndarray) -> int:
+    """Index of the first maximum of values"""
+    return int(np.argmax(values))
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def left_riemann_sum(wavelengths, values):
+        """Left Riemann sum of values over wavelengths (JIT-compiled)"""
+        total = 0.0
+        for i in range(values.shape[0] - 1):
+            total += values[i] * (wavelengths[i + 1] - wavelengths[i])
+        return total
+    
+    argmax = njit(cache=True)(_argmax_loop)
+else:
+    def left_riemann_sum(wavelengths: np.ndarray, values: np.ndarray) -> float:
+        """Left Riemann sum of values over wavelengths"""
+        return float(np.dot(values[:-1], np.diff(wavelengths)))
+    
+    argmax = _argmax_numpy
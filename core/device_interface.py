@@ -5,12 +5,17 @@
 #  to work with the portable GUI framework.
 #
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from queue import SimpleQueue
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 
+logger = logging.getLogger(__name__)
+
+
 class MeasurementType(Enum):
     """Standard measurement types supported by spectral devices"""
     RADIANCE = "radiance"
@@ -31,6 +36,24 @@ class DeviceStatus(Enum):
     BUSY = "busy"
 
 
+# Event name -> SpectralDevice attribute holding that event's callbacks
+_CALLBACK_ATTRS: Dict[str, str] = {
+    'status_changed': '_cb_status',
+    'measurement_complete': '_cb_measurement',
+    'error': '_cb_error',
+}
+
+
+# Human-readable status strings (ERROR is formatted with the last error message)
+_STATUS_MESSAGES: Dict[DeviceStatus, str] = {
+    DeviceStatus.DISCONNECTED: "Disconnected",
+    DeviceStatus.CONNECTING: "Connecting...",
+    DeviceStatus.CONNECTED: "Ready",
+    DeviceStatus.MEASURING: "Measuring...",
+    DeviceStatus.BUSY: "Busy",
+}
+
+
 @dataclass
 class SettingDefinition:
     """Definition of a configurable device setting"""
@@ -94,12 +117,14 @@ class SpectralDevice(ABC):
     
     def __init__(self):
         self._status = DeviceStatus.DISCONNECTED
+        self._connected = False  # Maintained by subclasses in connect()/disconnect()
         self._last_error: str = ""
-        self._callbacks: Dict[str, List[callable]] = {
-            'status_changed': [],
-            'measurement_complete': [],
-            'error': [],
-        }
+        self._status_str: str = "Disconnected"
+        # Callbacks are stored as tuples and replaced on (un)registration,
+        # so dispatch can iterate a snapshot without locking
+        self._cb_status: Tuple[callable, ...] = ()
+        self._cb_measurement: Tuple[callable, ...] = ()
+        self._cb_error: Tuple[callable, ...] = ()
     
     # =========================================================================
     # Abstract methods - MUST be implemented by all devices
@@ -123,16 +148,6 @@ class SpectralDevice(ABC):
         """
         pass
     
-    @abstractmethod
-    def is_connected(self) -> bool:
-        """
-        Check if device is currently connected.
-        
-        Returns:
-            True if connected and ready, False otherwise
-        """
-        pass
-    
     @abstractmethod
     def get_capabilities(self) -> DeviceCapabilities:
         """
@@ -188,6 +203,17 @@ class SpectralDevice(ABC):
     # Optional methods - Override if device supports these features
     # =========================================================================
     
+    def prepare_measurement(self) -> None:
+        """
+        Called by the GUI thread just before measure() is started on a
+        worker thread.
+        
+        Override to reset per-measurement state (e.g. an abort flag) here
+        rather than in measure(), where it would race with an abort
+        requested in between.
+        """
+        pass
+    
     def abort_measurement(self) -> bool:
         """
         Abort an in-progress measurement.
@@ -197,6 +223,29 @@ class SpectralDevice(ABC):
         """
         return False
     
+    def measure_stream(self, measurement_type: MeasurementType, count: int,
+                       out: 'SimpleQueue[MeasurementResult]') -> None:
+        """
+        Perform several consecutive measurements, pushing each result to a queue.
+        
+        Intended for continuous acquisition: results are handed to the
+        consumer as they arrive instead of one measure() call per scan.
+        The default implementation loops measure(); devices with a
+        continuous mode should override it to batch acquisitions.
+        
+        Stops early if a measurement fails (measure() returns None).
+        
+        Args:
+            measurement_type: Type of measurement to perform
+            count: Number of measurements to acquire
+            out: Queue receiving MeasurementResult objects
+        """
+        for _ in range(count):
+            result = self.measure(measurement_type)
+            if result is None:
+                break
+            out.put(result)
+    
     def perform_calibration(self, calibration_type: str) -> bool:
         """
         Perform device calibration.
@@ -231,6 +280,23 @@ class SpectralDevice(ABC):
     # Status and error handling
     # =========================================================================
     
+    def is_connected(self) -> bool:
+        """
+        Check if device is currently connected.
+        
+        Reads the _connected flag set by connect()/disconnect(). Override
+        only if the device needs a custom liveness check.
+        
+        Returns:
+            True if connected and ready, False otherwise
+        """
+        return self._connected
+    
+    @property
+    def connected(self) -> bool:
+        """True if the device is connected (same as is_connected())"""
+        return self.is_connected()
+    
     @property
     def status(self) -> DeviceStatus:
         """Get current device status"""
@@ -241,8 +307,9 @@ class SpectralDevice(ABC):
         """Set device status and notify callbacks"""
         old_status = self._status
         self._status = value
+        self._status_str = self._build_status_string()
         if old_status != value:
-            self._notify('status_changed', value)
+            self._fire_status(value)
     
     @property
     def last_error(self) -> str:
@@ -253,13 +320,15 @@ class SpectralDevice(ABC):
         """Set error state with message"""
         self._last_error = message
         self._status = DeviceStatus.ERROR
-        self._notify('error', message)
+        self._status_str = self._build_status_string()
+        self._fire_error(message)
     
     def clear_error(self):
         """Clear error state"""
         self._last_error = ""
         if self._status == DeviceStatus.ERROR:
             self._status = DeviceStatus.CONNECTED if self.is_connected() else DeviceStatus.DISCONNECTED
+        self._status_str = self._build_status_string()
     
     # =========================================================================
     # Event callbacks
@@ -274,38 +343,65 @@ class SpectralDevice(ABC):
             - 'measurement_complete': Called when measurement finishes
             - 'error': Called when an error occurs
         """
-        if event in self._callbacks:
-            self._callbacks[event].append(callback)
+        attr = _CALLBACK_ATTRS.get(event)
+        if attr is not None:
+            setattr(self, attr, getattr(self, attr) + (callback,))
     
     def unregister_callback(self, event: str, callback: callable):
         """Unregister a callback"""
-        if event in self._callbacks and callback in self._callbacks[event]:
-            self._callbacks[event].remove(callback)
+        attr = _CALLBACK_ATTRS.get(event)
+        if attr is not None and callback in getattr(self, attr):
+            callbacks = list(getattr(self, attr))
+            callbacks.remove(callback)
+            setattr(self, attr, tuple(callbacks))
+    
+    def _fire_status(self, status: DeviceStatus):
+        """Notify 'status_changed' callbacks"""
+        self._dispatch(self._cb_status, status)
+    
+    def _fire_measurement(self, result: 'MeasurementResult'):
+        """Notify 'measurement_complete' callbacks"""
+        self._dispatch(self._cb_measurement, result)
+    
+    def _fire_error(self, message: str):
+        """Notify 'error' callbacks"""
+        self._dispatch(self._cb_error, message)
     
     def _notify(self, event: str, data: Any = None):
-        """Notify all registered callbacks for an event"""
-        if event in self._callbacks:
-            for callback in self._callbacks[event]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    print(f"Callback error: {e}")
+        """Notify all registered callbacks for an event (by event name)"""
+        attr = _CALLBACK_ATTRS.get(event)
+        if attr is not None:
+            self._dispatch(getattr(self, attr), data)
+    
+    @staticmethod
+    def _dispatch(callbacks: Tuple[callable, ...], data: Any):
+        """Call each callback with data, logging (not raising) failures"""
+        if not callbacks:
+            return
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception:
+                logger.exception("Callback error")
     
     # =========================================================================
     # Utility methods
     # =========================================================================
     
     def get_status_string(self) -> str:
-        """Get human-readable status string"""
-        status_messages = {
-            DeviceStatus.DISCONNECTED: "Disconnected",
-            DeviceStatus.CONNECTING: "Connecting...",
-            DeviceStatus.CONNECTED: "Ready",
-            DeviceStatus.MEASURING: "Measuring...",
-            DeviceStatus.ERROR: f"Error: {self._last_error}",
-            DeviceStatus.BUSY: "Busy",
-        }
-        return status_messages.get(self._status, "Unknown")
+        """
+        Get human-readable status string.
+        
+        The string is built once per status change, so GUI status bars
+        can call this on every refresh for free.
+        """
+        return self._status_str
+    
+    def _build_status_string(self) -> str:
+        """Build the human-readable string for the current status"""
+        if self._status == DeviceStatus.ERROR:
+            return f"Error: {self._last_error}"
+        return _STATUS_MESSAGES.get(self._status, "Unknown")
     
     def __enter__(self):
         """Context manager entry - connect"""
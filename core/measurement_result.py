@@ -6,13 +6,22 @@
 #
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union, BinaryIO
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
 
-class MeasurementUnit(Enum):
-    """Standard units for spectral measurements"""
+from ._kernels import left_riemann_sum, argmax
+
+
+class MeasurementUnit(str, Enum):
+    """
+    Standard units for spectral measurements.
+    
+    Members are strings themselves (str(unit) == unit.value), so they can
+    be used directly wherever a unit label is expected.
+    """
     # Radiometric
     WATTS_PER_SQM_NM = "W/(m²·nm)"           # Spectral irradiance
     WATTS_PER_SR_SQM_NM = "W/(sr·m²·nm)"     # Spectral radiance
@@ -29,15 +38,57 @@ class MeasurementUnit(Enum):
     
     # Other
     ARBITRARY = "a.u."
+    
+    __str__ = str.__str__
+
+
+# Measurement type strings (MeasurementType values and short codes) that
+# report luminance / illuminance as their primary value
+RADIANCE_TYPES = frozenset({'radiance', 'r'})
+IRRADIANCE_TYPES = frozenset({'irradiance', 'i'})
+
+# Display unit for photometric measurement types
+_UNIT_BY_TYPE: Dict[str, str] = {
+    **dict.fromkeys(RADIANCE_TYPES, "cd/m²"),
+    **dict.fromkeys(IRRADIANCE_TYPES, "lux"),
+}
 
 
-@dataclass
+def _as_spectrum(values: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+    """
+    Coerce spectral input to a read-only 1-D floating point ndarray.
+    
+    Floating point arrays are not copied: read-only ones are returned
+    as-is (so a device's shared wavelength grid keeps its identity),
+    writable ones as a read-only view. Anything else (lists, integer
+    arrays) is converted to float64.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind != 'f':
+        arr = arr.astype(np.float64)
+    elif arr.flags.writeable:
+        arr = arr.view()
+    arr.flags.writeable = False
+    return arr
+
+
+@dataclass(eq=False, frozen=True, slots=True)
 class MeasurementResult:
     """
     Standard measurement result format.
     
     All spectral devices must return data in this format to ensure
     compatibility with the portable GUI framework.
+    
+    Spectral arrays are stored as read-only numpy arrays. Devices may pass
+    lists, they are converted once on construction. Float arrays are
+    stored without a copy: the caller must not write to them afterwards,
+    or the result (and its cached peak/integral) would change under it.
+    
+    Results are frozen so a single instance can be shared between the
+    measurement thread, the GUI and caches without defensive copies.
+    Uses __slots__ (no per-instance __dict__), so spectrum-derived values
+    are cached in dedicated private fields rather than cached_property.
     """
     
     # =========================================================================
@@ -45,8 +96,8 @@ class MeasurementResult:
     # =========================================================================
     
     # Spectral data
-    wavelengths: List[float]          # Wavelength array in nm
-    spectral_data: List[float]        # Calibrated spectral values
+    wavelengths: np.ndarray           # Wavelength array in nm
+    spectral_data: np.ndarray         # Calibrated spectral values
     
     # Measurement info
     measurement_type: str             # 'radiance', 'irradiance', etc.
@@ -84,14 +135,33 @@ class MeasurementResult:
     # Device info
     device_name: str = ""
     device_serial: str = ""
-    device_info: Dict[str, Any] = field(default_factory=dict)
+    device_info: Optional[Dict[str, Any]] = None   # See device_info_dict
     
     # Extra device-specific data
-    extra_data: Dict[str, Any] = field(default_factory=dict)
+    extra_data: Optional[Dict[str, Any]] = None    # See extra_data_dict
     
     # Error info
     error_message: str = ""
     
+    # =========================================================================
+    # Internal caches - Filled on first access of the computed properties
+    # =========================================================================
+    
+    _peak: Optional[Tuple[int, float]] = field(default=None, init=False, repr=False)  # (index, value)
+    _range: Optional[tuple] = field(default=None, init=False, repr=False)
+    _integrated: Optional[float] = field(default=None, init=False, repr=False)
+    _iso_ts: str = field(default="", init=False, repr=False)      # timestamp.isoformat()
+    _time_hms: str = field(default="", init=False, repr=False)    # timestamp as HH:MM:SS
+    
+    def __post_init__(self):
+        """Convert spectral inputs to numpy arrays and pre-format the timestamp"""
+        # Frozen dataclass: normalize fields through object.__setattr__
+        _set = object.__setattr__
+        _set(self, 'wavelengths', _as_spectrum(self.wavelengths))
+        _set(self, 'spectral_data', _as_spectrum(self.spectral_data))
+        _set(self, '_iso_ts', self.timestamp.isoformat())
+        _set(self, '_time_hms', self.timestamp.strftime('%H:%M:%S'))
+    
     # =========================================================================
     # Computed properties
     # =========================================================================
@@ -99,59 +169,89 @@ class MeasurementResult:
     @property
     def pixel_count(self) -> int:
         """Number of spectral pixels"""
-        return len(self.wavelengths)
+        return self.wavelengths.size
     
     @property
     def wavelength_range(self) -> tuple:
         """(min_wavelength, max_wavelength) in nm"""
-        if self.wavelengths:
-            return (min(self.wavelengths), max(self.wavelengths))
-        return (0, 0)
+        if self._range is None:
+            if self.wavelengths.size:
+                value = (float(self.wavelengths.min()), float(self.wavelengths.max()))
+            else:
+                value = (0, 0)
+            object.__setattr__(self, '_range', value)
+        return self._range
+    
+    @property
+    def peak_index(self) -> int:
+        """Index of the maximum intensity sample (0 if there is no data)"""
+        if self.spectral_data.size:
+            return self._get_peak()[0]
+        return 0
     
     @property
     def peak_wavelength(self) -> float:
         """Wavelength at maximum intensity"""
-        if self.spectral_data and self.wavelengths:
-            max_idx = self.spectral_data.index(max(self.spectral_data))
-            return self.wavelengths[max_idx]
+        if self.spectral_data.size and self.wavelengths.size:
+            return float(self.wavelengths[self._get_peak()[0]])
         return 0.0
     
     @property
     def peak_value(self) -> float:
         """Maximum spectral value"""
-        if self.spectral_data:
-            return max(self.spectral_data)
+        if self.spectral_data.size:
+            return self._get_peak()[1]
         return 0.0
     
     @property
     def integrated_value(self) -> float:
-        """Integrated (total) spectral power"""
-        if len(self.spectral_data) < 2 or len(self.wavelengths) < 2:
-            return 0.0
-        
-        total = 0.0
-        for i in range(len(self.spectral_data) - 1):
-            dw = self.wavelengths[i + 1] - self.wavelengths[i]
-            total += self.spectral_data[i] * dw
-        return total
+        """Integrated (total) spectral power (left Riemann sum, cached)"""
+        if self._integrated is None:
+            if self.spectral_data.size < 2 or self.wavelengths.size < 2:
+                value = 0.0
+            else:
+                value = float(left_riemann_sum(self.wavelengths, self.spectral_data))
+            object.__setattr__(self, '_integrated', value)
+        return self._integrated
+    
+    def _get_peak(self) -> Tuple[int, float]:
+        """(index, value) of the spectral maximum from a single argmax scan"""
+        if self._peak is None:
+            idx = int(argmax(self.spectral_data))
+            object.__setattr__(self, '_peak', (idx, float(self.spectral_data[idx])))
+        return self._peak
+    
+    @property
+    def device_info_dict(self) -> Dict[str, Any]:
+        """Device info dict, allocated on first use"""
+        if self.device_info is None:
+            object.__setattr__(self, 'device_info', {})
+        return self.device_info
+    
+    @property
+    def extra_data_dict(self) -> Dict[str, Any]:
+        """Extra device-specific data dict, allocated on first use"""
+        if self.extra_data is None:
+            object.__setattr__(self, 'extra_data', {})
+        return self.extra_data
     
     @property
     def display_value(self) -> float:
         """Primary display value based on measurement type"""
-        if self.measurement_type in ('radiance', 'r'):
+        mt = self.measurement_type
+        if mt in RADIANCE_TYPES:
             return self.luminance
-        elif self.measurement_type in ('irradiance', 'i'):
+        if mt in IRRADIANCE_TYPES:
             return self.illuminance
         return self.integrated_value
     
     @property
     def display_unit(self) -> str:
         """Unit string for primary display value"""
-        if self.measurement_type in ('radiance', 'r'):
-            return "cd/m²"
-        elif self.measurement_type in ('irradiance', 'i'):
-            return "lux"
-        return str(self.spectral_unit.value)
+        unit = _UNIT_BY_TYPE.get(self.measurement_type)
+        if unit is not None:
+            return unit
+        return self.spectral_unit
     
     # =========================================================================
     # Methods
@@ -160,18 +260,18 @@ class MeasurementResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
-            'wavelengths': self.wavelengths,
-            'spectral_data': self.spectral_data,
+            'wavelengths': self.wavelengths.tolist(),
+            'spectral_data': self.spectral_data.tolist(),
             'measurement_type': self.measurement_type,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self._iso_ts,
             'luminance': self.luminance,
             'illuminance': self.illuminance,
             'integration_time_ms': self.integration_time_ms,
             'num_scans': self.num_scans,
             'saturation_level': self.saturation_level,
             'device_name': self.device_name,
-            'device_info': self.device_info,
-            'extra_data': self.extra_data,
+            'device_info': self.device_info if self.device_info is not None else {},
+            'extra_data': self.extra_data if self.extra_data is not None else {},
         }
     
     @classmethod
@@ -180,18 +280,45 @@ class MeasurementResult:
         data['timestamp'] = datetime.fromisoformat(data['timestamp'])
         return cls(**data)
     
+    @staticmethod
+    def build_csv_header(wavelengths: np.ndarray) -> str:
+        """CSV header line (without newline) for rows on this wavelength grid"""
+        wavelength_headers = ",".join(np.char.mod("%.2f", wavelengths).tolist())
+        return f"timestamp,type,luminance,int_time_ms,num_scans,saturation,{wavelength_headers}"
+    
     def to_csv_row(self, include_header: bool = False) -> str:
         """Generate CSV row for this measurement"""
         header = ""
         if include_header:
-            wavelength_headers = ",".join(f"{w:.2f}" for w in self.wavelengths)
-            header = f"timestamp,type,luminance,int_time_ms,num_scans,saturation,{wavelength_headers}\n"
+            header = self.build_csv_header(self.wavelengths) + "\n"
         
-        spectral_values = ",".join(f"{v:.6e}" for v in self.spectral_data)
-        row = f"{self.timestamp.isoformat()},{self.measurement_type},{self.display_value:.6e},{self.integration_time_ms},{self.num_scans},{self.saturation_level:.4f},{spectral_values}"
+        spectral_values = ",".join(np.char.mod("%.6e", self.spectral_data).tolist())
+        row = ",".join((self._csv_prefix(), spectral_values))
         
         return header + row
     
+    def to_csv_bytes(self, buf: BinaryIO) -> None:
+        """
+        Write the CSV row for this measurement to a binary stream.
+        
+        Same content as to_csv_row() (plus a trailing newline), but the
+        spectral values are formatted and written by numpy directly,
+        skipping the intermediate Python string.
+        """
+        buf.write(f"{self._csv_prefix()},".encode())
+        np.savetxt(buf, self.spectral_data[np.newaxis, :], fmt="%.6e", delimiter=",")
+    
+    def _csv_prefix(self) -> str:
+        """Metadata columns of the CSV row"""
+        return ",".join((
+            self._iso_ts,
+            self.measurement_type,
+            f"{self.display_value:.6e}",
+            str(self.integration_time_ms),
+            str(self.num_scans),
+            f"{self.saturation_level:.4f}",
+        ))
+    
     def get_summary(self) -> str:
         """Get human-readable summary"""
         return (
@@ -200,11 +327,11 @@ class MeasurementResult:
             f"Integration: {self.integration_time_ms}ms\n"
             f"Scans: {self.num_scans}\n"
             f"Saturation: {self.saturation_level:.1%}\n"
-            f"Time: {self.timestamp.strftime('%H:%M:%S')}"
+            f"Time: {self._time_hms}"
         )
 
 
-@dataclass  
+@dataclass(slots=True)
 class MeasurementError:
     """Represents a measurement error"""
     error_type: str
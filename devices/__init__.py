@@ -2,6 +2,12 @@
 #  Spectral GUI Framework - Devices Module
 #
 
-from .osprad_device import OSpRadDevice
-
 __all__ = ['OSpRadDevice']
+
+
+def __getattr__(name):
+    """Import device drivers on first use (their dependencies can be heavy)"""
+    if name == 'OSpRadDevice':
+        from .osprad_device import OSpRadDevice
+        return OSpRadDevice
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
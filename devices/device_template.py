@@ -8,11 +8,14 @@
 #  2. Rename the class to YourDevice
 #  3. Implement all abstract methods
 #  4. Add your device to devices/__init__.py
-#  5. Add your device to main.py get_device() function
+#  5. Add your device to _DEVICE_FACTORIES in main.py
 #
 
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from queue import SimpleQueue
+
+import numpy as np
 
 from ..core.device_interface import (
     SpectralDevice, DeviceCapabilities, DeviceStatus, 
@@ -32,7 +35,11 @@ class DeviceTemplate(SpectralDevice):
         super().__init__()
         
         # Initialize device-specific variables
-        self._connected = False
+        # (self._connected is provided by SpectralDevice, keep it updated
+        # in connect()/disconnect() and is_connected() works as-is)
+        
+        # Wavelength grid, read once on connect and shared by all results
+        self._wavelengths: Optional[np.ndarray] = None
         
         # TODO: Add your device-specific initialization
     
@@ -54,6 +61,14 @@ class DeviceTemplate(SpectralDevice):
             # Example:
             # self.device = YourDeviceLibrary.connect()
             
+            # The wavelength grid is fixed for a device: build it once here
+            # instead of on every measurement. Read-only because it is
+            # shared by every MeasurementResult.
+            # Example:
+            # self._wavelengths = np.asarray(self.device.get_wavelengths(), dtype=np.float32)
+            self._wavelengths = np.arange(380, 781, dtype=np.float32)
+            self._wavelengths.flags.writeable = False
+            
             self._connected = True
             self.status = DeviceStatus.CONNECTED
             return True
@@ -76,10 +91,6 @@ class DeviceTemplate(SpectralDevice):
         self._connected = False
         self.status = DeviceStatus.DISCONNECTED
     
-    def is_connected(self) -> bool:
-        """Check if device is connected"""
-        return self._connected
-    
     def get_capabilities(self) -> DeviceCapabilities:
         """
         Return device capabilities.
@@ -179,15 +190,14 @@ class DeviceTemplate(SpectralDevice):
             # TODO: Perform measurement with your device
             # Example:
             # spectrum = self.device.get_spectrum()
-            # wavelengths = self.device.get_wavelengths()
             
             # Placeholder data - replace with actual measurement
-            wavelengths = [380 + i for i in range(401)]
-            spectral_data = [0.0] * 401
+            # Return numpy arrays directly, no need to build Python lists
+            spectral_data = np.zeros(self._wavelengths.size, dtype=np.float32)
             
             # Create result
             result = MeasurementResult(
-                wavelengths=wavelengths,
+                wavelengths=self._wavelengths,  # Shared, built in connect()
                 spectral_data=spectral_data,
                 measurement_type=measurement_type.value,
                 timestamp=datetime.now(),
@@ -246,6 +256,50 @@ class DeviceTemplate(SpectralDevice):
         # return True
         return False
     
+    def measure_stream(self, measurement_type: MeasurementType, count: int,
+                       out: SimpleQueue) -> None:
+        """
+        Perform several consecutive measurements (continuous mode).
+        
+        Override if your device supports continuous acquisition. The
+        spectra are written into one pre-allocated block and each result
+        wraps a row of it, so no per-scan allocation is needed.
+        
+        Each row is written once, before its result is created, and never
+        reused: results keep referencing their row, so recycling buffers
+        would change the data of results already handed out.
+        """
+        if not self.is_connected():
+            self.set_error("Device not connected")
+            return
+        
+        buffer = np.empty((count, self._wavelengths.size), dtype=np.float32)
+        
+        self.status = DeviceStatus.MEASURING
+        
+        try:
+            for i in range(count):
+                # TODO: Read one spectrum from your device into the buffer row
+                # Example:
+                # self.device.read_spectrum_into(buffer[i])
+                buffer[i] = 0.0
+                
+                out.put(MeasurementResult(
+                    wavelengths=self._wavelengths,  # Shared by all results
+                    spectral_data=buffer[i],  # View, no copy (row not written again)
+                    measurement_type=measurement_type.value,
+                    timestamp=datetime.now(),
+                    integration_time_ms=100,
+                    num_scans=1,
+                    spectral_unit=MeasurementUnit.WATTS_PER_SQM_NM,
+                    device_name="Your Device",
+                ))
+            
+            self.status = DeviceStatus.CONNECTED
+            
+        except Exception as e:
+            self.set_error(f"Measurement failed: {e}")
+    
     def perform_calibration(self, calibration_type: str) -> bool:
         """
         Perform device calibration.
@@ -274,8 +328,8 @@ class DeviceTemplate(SpectralDevice):
 #    from .your_device import YourDevice
 #    __all__ = ['OSpRadDevice', 'YourDevice']
 #
-# 2. Add to spectral_gui/main.py get_device():
-#    devices = {
+# 2. Add to _DEVICE_FACTORIES in spectral_gui/main.py:
+#    _DEVICE_FACTORIES = {
 #        'osprad': lambda: OSpRadDevice(),
 #        'mock': create_mock_device,
 #        'yourdevice': lambda: YourDevice(),  # Add this line
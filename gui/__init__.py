@@ -4,5 +4,6 @@
 
 from .main_window import SpectralMeasurementGUI
 from .plot_window import PlotWindow
+from .fast_canvas import FastSpectrumCanvas
 
-__all__ = ['SpectralMeasurementGUI', 'PlotWindow']
+__all__ = ['SpectralMeasurementGUI', 'PlotWindow', 'FastSpectrumCanvas']
@@ -0,0 +1,112 @@
+#
+#  Fast Spectrum Canvas
+#
+#  Lightweight live spectrum display drawn with native Tk canvas items.
+#  Much faster than matplotlib for rapid updates, but without zoom,
+#  overlays or export - PlotWindow keeps matplotlib for those.
+#
+
+import tkinter as tk
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class FastSpectrumCanvas(tk.Canvas):
+    """
+    Live spectrum display using a single Tk canvas polyline.
+    
+    Each update maps the spectrum to pixel coordinates with numpy and
+    moves the points of a pre-created line item, so no image has to be
+    rendered and copied to the screen.
+    
+    The Y axis is autoscaled to the data, the X axis spans the
+    wavelength grid.
+    """
+    
+    PADDING = 40  # Pixels between the plot area and the canvas edge
+    
+    def __init__(self, parent, line_color: str = 'blue', **kwargs):
+        kwargs.setdefault('background', 'white')
+        kwargs.setdefault('highlightthickness', 0)
+        super().__init__(parent, **kwargs)
+        
+        self._wavelengths: Optional[np.ndarray] = None
+        self._data: Optional[np.ndarray] = None
+        self._size: Tuple[int, int] = (1, 1)
+        
+        # Pixel x coordinates, reused while the wavelength grid and the
+        # canvas size stay the same (devices share one grid across results)
+        self._x_pixels: Optional[np.ndarray] = None
+        self._x_key: Optional[tuple] = None  # (wavelengths, size) of _x_pixels
+        
+        # Canvas items, created once and only moved/relabeled afterwards
+        self._frame_id = self.create_rectangle(0, 0, 0, 0, outline='gray')
+        self._line_id = self.create_line(0, 0, 0, 0, fill=line_color, width=1.5)
+        self._xmin_id = self.create_text(0, 0, anchor='n', fill='gray')
+        self._xmax_id = self.create_text(0, 0, anchor='n', fill='gray')
+        self._ymin_id = self.create_text(0, 0, anchor='sw', fill='gray')
+        self._ymax_id = self.create_text(0, 0, anchor='nw', fill='gray')
+        
+        self.bind('<Configure>', self._on_resize)
+    
+    def set_spectrum(self, wavelengths: np.ndarray, data: np.ndarray):
+        """
+        Display a spectrum.
+        
+        Args:
+            wavelengths: Wavelength array (monotonic)
+            data: Spectral data array, same length as wavelengths
+        """
+        self._wavelengths = wavelengths
+        self._data = data
+        self._redraw()
+    
+    def clear(self):
+        """Remove the displayed spectrum"""
+        self._wavelengths = None
+        self._data = None
+        self.coords(self._line_id, 0, 0, 0, 0)
+    
+    def _on_resize(self, event):
+        """Refit the plot area to the new canvas size"""
+        self._size = (event.width, event.height)
+        pad = self.PADDING
+        self.coords(self._frame_id, pad, pad, event.width - pad, event.height - pad)
+        self._redraw()
+    
+    def _redraw(self):
+        """Map the current spectrum to pixel coordinates and move the line"""
+        wavelengths, data = self._wavelengths, self._data
+        if wavelengths is None or len(data) < 2:
+            return
+        
+        width, height = self._size
+        pad = self.PADDING
+        if width <= 2 * pad or height <= 2 * pad:
+            return  # Not laid out yet, or too small to draw into
+        
+        x0, x1 = float(wavelengths[0]), float(wavelengths[-1])
+        y0, y1 = float(data.min()), float(data.max())
+        margin = (y1 - y0) * 0.1 if y1 != y0 else 0.1
+        y0, y1 = y0 - margin, y1 + margin
+        x_span = x1 - x0 if x1 != x0 else 1.0
+        
+        # Interleaved x, y pixel coordinates as one flat list for Tk
+        if self._x_key is None or self._x_key[0] is not wavelengths or self._x_key[1] != self._size:
+            self._x_pixels = pad + (wavelengths - x0) * ((width - 2 * pad) / x_span)
+            self._x_key = (wavelengths, self._size)
+        coords = np.empty((len(data), 2))
+        coords[:, 0] = self._x_pixels
+        coords[:, 1] = (height - pad) - (data - y0) * ((height - 2 * pad) / (y1 - y0))
+        self.coords(self._line_id, *coords.ravel().tolist())
+        
+        # Axis range labels
+        self.coords(self._xmin_id, pad, height - pad + 4)
+        self.itemconfig(self._xmin_id, text=f"{x0:.0f} nm")
+        self.coords(self._xmax_id, width - pad, height - pad + 4)
+        self.itemconfig(self._xmax_id, text=f"{x1:.0f} nm")
+        self.coords(self._ymin_id, pad + 4, height - pad - 2)
+        self.itemconfig(self._ymin_id, text=f"{y0:.3g}")
+        self.coords(self._ymax_id, pad + 4, pad + 2)
+        self.itemconfig(self._ymax_id, text=f"{y1:.3g}")
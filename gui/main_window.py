@@ -14,16 +14,26 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
-from queue import Queue, Empty
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from queue import SimpleQueue, Empty
+from collections import deque, namedtuple
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from datetime import datetime, timedelta
 import time
+import os
 
-from ..core.device_interface import SpectralDevice, DeviceStatus, MeasurementType
-from ..core.measurement_result import MeasurementResult
+import numpy as np
+
+from ..core.device_interface import SpectralDevice, DeviceStatus, MeasurementType, SettingDefinition
+from ..core.measurement_result import MeasurementResult, RADIANCE_TYPES, IRRADIANCE_TYPES
 from .plot_window import PlotWindow
 
 
+# A saved measurement: data tree label, result and its encoded CSV row
+SavedEntry = namedtuple('SavedEntry', 'label result csv_bytes')
+
+
 class SpectralMeasurementGUI:
     """
     Portable, device-agnostic GUI for spectral measurements.
@@ -37,6 +47,61 @@ class SpectralMeasurementGUI:
     - Detached plot window for performance
     """
     
+    # =========================================================================
+    # Setting widget factories (dispatched on SettingDefinition.setting_type)
+    # =========================================================================
+    
+    @staticmethod
+    def _make_entry(parent: ttk.Frame, var: tk.Variable, setting: SettingDefinition) -> ttk.Widget:
+        """Entry for int, float and free-text settings"""
+        return ttk.Entry(parent, textvariable=var, width=15)
+    
+    @staticmethod
+    def _make_check(parent: ttk.Frame, var: tk.Variable, setting: SettingDefinition) -> ttk.Widget:
+        """Checkbutton for bool settings"""
+        return ttk.Checkbutton(parent, variable=var)
+    
+    @staticmethod
+    def _make_combo(parent: ttk.Frame, var: tk.Variable, setting: SettingDefinition) -> ttk.Widget:
+        """Read-only combobox for choice settings (entry if no choices are given)"""
+        if not setting.choices:
+            return ttk.Entry(parent, textvariable=var, width=15)
+        return ttk.Combobox(parent, textvariable=var, values=setting.choices,
+                            state='readonly', width=15)
+    
+    _WIDGET_FACTORY: Dict[str, Callable] = {
+        'int': _make_entry,
+        'float': _make_entry,
+        'bool': _make_check,
+        'choice': _make_combo,
+    }
+    
+    # Tk variable class per setting type (anything else is stored as a string)
+    _VAR_TYPES: Dict[str, type] = {
+        'int': tk.IntVar,
+        'float': tk.DoubleVar,
+        'bool': tk.BooleanVar,
+    }
+    
+    # Settings tab only gets a scrollable viewport above this many settings
+    _MAX_UNSCROLLED_SETTINGS = 12
+    
+    # Stabilization delay between auto-repeat measurements (seconds)
+    _AUTO_REPEAT_SETTLE_S = 1.0
+    
+    # Auto-repeat stops after this many measurement errors in a row
+    _MAX_AUTO_REPEAT_ERRORS = 5
+    
+    # Status indicator color for each device status
+    _STATUS_COLORS: Dict[DeviceStatus, str] = {
+        DeviceStatus.DISCONNECTED: 'gray',
+        DeviceStatus.CONNECTING: 'yellow',
+        DeviceStatus.CONNECTED: 'green',
+        DeviceStatus.MEASURING: 'blue',
+        DeviceStatus.ERROR: 'red',
+        DeviceStatus.BUSY: 'orange',
+    }
+    
     def __init__(self, root: tk.Tk, device: SpectralDevice):
         self.root = root
         self.device = device
@@ -50,19 +115,39 @@ class SpectralMeasurementGUI:
         self.root.minsize(600, 500)
         
         # Threading for non-blocking measurements
-        self.measurement_queue: Queue = Queue()
+        self.measurement_queue: SimpleQueue = SimpleQueue()
         self.is_measuring = False
         self.abort_requested = False
+        self.is_exporting = False
+        self._last_status: Optional[Tuple[str, str]] = None  # Shown (message, color)
+        # Settings last successfully sent to the device (None: unknown)
+        self._last_applied_settings: Optional[Dict[str, Any]] = None
         
         # State
         self.current_result: Optional[MeasurementResult] = None
-        self.measurement_history: List[MeasurementResult] = []
-        self.saved_labels: List[str] = []
+        # Saved measurements, in data tree order
+        self.saved_entries: List[SavedEntry] = []
+        # (wavelength grid, encoded CSV header) of the last export
+        self._csv_header: Tuple[Optional[np.ndarray], bytes] = (None, b"")
+        
+        # Plot throttling: at most _plot_max_hz redraws per second, latest result wins
+        self._plot_max_hz = 10
+        self._last_plot_ts = 0.0
+        self._pending_plot: Optional[MeasurementResult] = None
+        self._plot_job = None
         
         # Auto-repeat state
         self.auto_repeat_active = False
         self.auto_repeat_job = None
         self.auto_repeat_waiting_for_measurement = False
+        # Monotonic time at which the next auto-repeat measurement may start
+        self._auto_repeat_deadline = 0.0
+        
+        # Directory of the last export, so file dialogs reopen there
+        self._last_export_dir: Optional[str] = None
+        
+        # Recent measurement errors as (time, message), viewable with Ctrl+Shift+E
+        self._error_log: deque = deque(maxlen=200)
         
         # UI variables
         self._create_variables()
@@ -74,16 +159,15 @@ class SpectralMeasurementGUI:
         self._create_notebook()
         self._setup_keyboard_shortcuts()
         
-        # Create detached plot window (hidden initially)
-        self.plot_window = PlotWindow(self.root, f"Spectrum - {self.capabilities.device_name}")
-        self.plot_window.withdraw()
+        # Detached plot window, created on first use (see _ensure_plot)
+        self.plot_window: Optional[PlotWindow] = None
         
         # Register device callbacks
         self.device.register_callback('status_changed', self._on_device_status_changed)
         self.device.register_callback('error', self._on_device_error)
         
-        # Start queue processing
-        self._process_queue()
+        # Results are delivered by the measurement thread scheduling
+        # _drain_queue on the Tk loop - no idle polling
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -100,16 +184,22 @@ class SpectralMeasurementGUI:
         
         # Settings variables (created dynamically from capabilities)
         self.setting_vars: Dict[str, tk.Variable] = {}
+        # (variable, default) pairs, so resetting doesn't walk capabilities again
+        setting_defaults = []
         for setting in self.capabilities.settings:
-            if setting.setting_type == 'int':
-                var = tk.IntVar(value=setting.default_value)
-            elif setting.setting_type == 'float':
-                var = tk.DoubleVar(value=setting.default_value)
-            elif setting.setting_type == 'bool':
-                var = tk.BooleanVar(value=setting.default_value)
+            var_type = self._VAR_TYPES.get(setting.setting_type)
+            if var_type is not None:
+                var = var_type(value=setting.default_value)
             else:
                 var = tk.StringVar(value=str(setting.default_value))
             self.setting_vars[setting.name] = var
+            setting_defaults.append((var, setting.default_value))
+        self._setting_defaults: Tuple[Tuple[tk.Variable, Any], ...] = tuple(setting_defaults)
+        
+        # (name, getter) pairs read on every measurement start
+        self._setting_getters: Tuple[Tuple[str, Callable], ...] = tuple(
+            (name, var.get) for name, var in self.setting_vars.items()
+        )
         
         # Save label
         self.save_label = tk.StringVar()
@@ -126,6 +216,9 @@ class SpectralMeasurementGUI:
         self.auto_repeat_target_count = 0
         self.auto_repeat_settings = {}  # Snapshot of settings for auto-repeat
         self.auto_repeat_measurements = []  # Store measurements during auto-repeat
+        self._auto_queue: deque = deque()  # Types still to measure in the current round
+        self._last_progress_text = ''  # Last text shown in the progress label
+        self._auto_repeat_error_count = 0  # Consecutive errors during auto-repeat
     
     def _apply_theme(self):
         """Apply modern ttk theme"""
@@ -159,6 +252,7 @@ class SpectralMeasurementGUI:
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Import Data...", command=self._import_csv)
         file_menu.add_command(label="Export Data...", command=self._export_data, accelerator="Ctrl+E")
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self._on_close, accelerator="Ctrl+Q")
@@ -175,6 +269,7 @@ class SpectralMeasurementGUI:
         view_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="View", menu=view_menu)
         view_menu.add_command(label="Show Plot Window", command=self._toggle_plot_window, accelerator="Ctrl+P")
+        view_menu.add_command(label="Error Log", command=self._show_error_log, accelerator="Ctrl+Shift+E")
         
         # Device menu
         device_menu = tk.Menu(menubar, tearoff=0)
@@ -208,9 +303,10 @@ class SpectralMeasurementGUI:
         self.status_label = ttk.Label(inner_frame, text="Initializing...", style='Status.TLabel')
         self.status_label.pack(side=tk.LEFT)
         
-        # Device info on right
+        # Device info on right (fixed while connected, see _refresh_device_info)
         self.device_info_label = ttk.Label(inner_frame, text="", style='Status.TLabel')
         self.device_info_label.pack(side=tk.RIGHT)
+        self._refresh_device_info()
         
         # Progress bar (hidden by default)
         self.progress_frame = ttk.Frame(status_frame)
@@ -281,9 +377,9 @@ class SpectralMeasurementGUI:
         right_frame.grid(row=0, column=1, sticky='nsew', padx=(5, 0), pady=5)
         
         # Result display
-        self.result_text = tk.Text(right_frame, height=12, width=35, font=('Consolas', 10),
-                                    state='disabled', wrap='word')
-        self.result_text.pack(fill=tk.BOTH, expand=True)
+        self.result_var = tk.StringVar()
+        ttk.Label(right_frame, textvariable=self.result_var, width=35, font=('Consolas', 10),
+                  justify='left', anchor='nw').pack(fill=tk.BOTH, expand=True)
         
         # Plot button
         plot_btn_frame = ttk.Frame(right_frame)
@@ -299,23 +395,25 @@ class SpectralMeasurementGUI:
         tab = ttk.Frame(self.notebook, padding=10)
         self.notebook.add(tab, text="  Settings  ")
         
-        # Scrollable frame for many settings
-        canvas = tk.Canvas(tab, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Most devices have a handful of settings: lay them out directly.
+        # Only long lists get a scrollable canvas viewport.
+        if len(self.capabilities.settings) > self._MAX_UNSCROLLED_SETTINGS:
+            canvas = tk.Canvas(tab, highlightthickness=0)
+            scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
+            settings_frame = ttk.Frame(canvas)
+            canvas.create_window((0, 0), window=settings_frame, anchor="nw")
+            canvas.configure(yscrollcommand=scrollbar.set)
+            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        else:
+            canvas = None
+            settings_frame = ttk.Frame(tab)
+            settings_frame.pack(fill=tk.BOTH, expand=True)
         
         # Build settings UI from capabilities
         row = 0
         for setting in self.capabilities.settings:
-            frame = ttk.Frame(scrollable_frame)
+            frame = ttk.Frame(settings_frame)
             frame.grid(row=row, column=0, sticky='ew', pady=5, padx=5)
             frame.columnconfigure(1, weight=1)
             
@@ -327,15 +425,8 @@ class SpectralMeasurementGUI:
             
             # Input widget based on type
             var = self.setting_vars[setting.name]
-            
-            if setting.setting_type == 'bool':
-                widget = ttk.Checkbutton(frame, variable=var)
-            elif setting.setting_type == 'choice' and setting.choices:
-                widget = ttk.Combobox(frame, textvariable=var, values=setting.choices, 
-                                       state='readonly', width=15)
-            else:
-                widget = ttk.Entry(frame, textvariable=var, width=15)
-            
+            factory = self._WIDGET_FACTORY.get(setting.setting_type, self._make_entry)
+            widget = factory(frame, var, setting)
             widget.grid(row=0, column=1, sticky='w', padx=(10, 0))
             
             # Tooltip
@@ -352,14 +443,18 @@ class SpectralMeasurementGUI:
             row += 1
         
         # Apply button
-        btn_frame = ttk.Frame(scrollable_frame)
+        btn_frame = ttk.Frame(settings_frame)
         btn_frame.grid(row=row, column=0, sticky='ew', pady=20, padx=5)
         
         ttk.Button(btn_frame, text="Apply Settings", command=self._apply_settings).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Reset to Defaults", command=self._reset_settings).pack(side=tk.LEFT, padx=5)
         
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        if canvas is not None:
+            # The settings list is static: set the scroll region once after
+            # layout instead of recomputing bbox("all") on every <Configure>
+            self.root.after_idle(lambda: canvas.configure(scrollregion=(
+                0, 0, settings_frame.winfo_reqwidth(), settings_frame.winfo_reqheight()
+            )))
     
     def _create_auto_repeat_tab(self):
         """Create auto-repeat configuration tab"""
@@ -433,16 +528,17 @@ class SpectralMeasurementGUI:
         self.data_tree.column('time', width=100)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.data_tree.yview)
-        self.data_tree.configure(yscrollcommand=scrollbar.set)
+        self.data_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.data_tree.yview)
+        self.data_tree.configure(yscrollcommand=self.data_scrollbar.set)
         
         self.data_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.data_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Buttons
         btn_frame = ttk.Frame(tab)
         btn_frame.pack(fill=tk.X, pady=10)
         
+        ttk.Button(btn_frame, text="Import...", command=self._import_csv).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Export Selected", command=self._export_selected).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Export All", command=self._export_data).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Delete Selected", command=self._delete_selected).pack(side=tk.LEFT, padx=5)
@@ -454,19 +550,30 @@ class SpectralMeasurementGUI:
     
     def _setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts"""
-        self.root.bind('<F5>', lambda e: self._measure())
-        self.root.bind('<Control-m>', lambda e: self._measure())
-        self.root.bind('<Control-s>', lambda e: self._save_measurement())
-        self.root.bind('<Control-p>', lambda e: self._toggle_plot_window())
-        self.root.bind('<Control-e>', lambda e: self._export_data())
-        self.root.bind('<Control-q>', lambda e: self._on_close())
-        self.root.bind('<Escape>', lambda e: self._abort_measurement())
-        
-        # Measurement type shortcuts
-        for i, mtype in enumerate(self.capabilities.measurement_types):
-            if i < 9:  # Ctrl+1 through Ctrl+9
-                self.root.bind(f'<Control-{i+1}>', 
-                              lambda e, t=mtype.value: self._quick_measure(t))
+        shortcuts = (
+            ('<F5>', self._measure),
+            ('<Control-m>', self._measure),
+            ('<Control-s>', self._save_measurement),
+            ('<Control-p>', self._toggle_plot_window),
+            ('<Control-e>', self._export_data),
+            ('<Control-E>', self._show_error_log),
+            ('<Control-q>', self._on_close),
+            ('<Escape>', self._abort_measurement),
+        )
+        for sequence, action in shortcuts:
+            self.root.bind(sequence, partial(self._on_shortcut, action))
+        
+        # Measurement type shortcuts (Ctrl+1 through Ctrl+9)
+        for i, mtype in enumerate(self.capabilities.measurement_types[:9]):
+            self.root.bind(f'<Control-{i+1}>', partial(self._on_quick_measure_key, mtype.value))
+    
+    def _on_shortcut(self, action: Callable[[], Any], event: tk.Event):
+        """Key binding handler: run the bound action, ignoring the event"""
+        action()
+    
+    def _on_quick_measure_key(self, measurement_type: str, event: tk.Event):
+        """Key binding handler for Ctrl+<n> quick measurements"""
+        self._quick_measure(measurement_type)
     
     # =========================================================================
     # Measurement Functions
@@ -477,13 +584,16 @@ class SpectralMeasurementGUI:
         if self.is_measuring:
             messagebox.showwarning("Busy", "A measurement is already in progress")
             return
+        if self.is_exporting:
+            messagebox.showwarning("Busy", "Please wait for the export to finish")
+            return
         
         measurement_type = self.measurement_type.get()
         self._start_measurement_thread(measurement_type)
     
     def _quick_measure(self, measurement_type: str):
         """Quick measure with specific type"""
-        if self.is_measuring:
+        if self.is_measuring or self.is_exporting:
             return
         
         self.measurement_type.set(measurement_type)
@@ -500,22 +610,32 @@ class SpectralMeasurementGUI:
         self._show_progress(True)
         self._set_status("Measuring...", "yellow")
         
-        # Get current settings
-        settings = {name: var.get() for name, var in self.setting_vars.items()}
-        
-        # Start thread
+        self._launch_measurement(measurement_type, self._current_settings())
+    
+    def _launch_measurement(self, measurement_type: str, settings: Dict[str, Any]):
+        """Start the measurement worker (UI thread only)"""
+        # Decide here whether the device needs configuring, so the marker is
+        # only ever written on the UI thread; a failed configure clears it
+        # again via the 'configure_failed' queue message.
+        needs_configure = settings != self._last_applied_settings
+        if needs_configure:
+            self._last_applied_settings = dict(settings)
+        
+        self.device.prepare_measurement()
         thread = threading.Thread(
             target=self._measurement_thread,
-            args=(measurement_type, settings),
+            args=(measurement_type, settings, needs_configure),
             daemon=True
         )
         thread.start()
     
-    def _measurement_thread(self, measurement_type: str, settings: Dict[str, Any]):
+    def _measurement_thread(self, measurement_type: str, settings: Dict[str, Any],
+                            needs_configure: bool):
         """Background thread for measurement"""
         try:
-            # Apply settings
-            self.device.configure(settings)
+            # Apply settings (skipped when the device already has them)
+            if needs_configure and not self.device.configure(settings):
+                self.measurement_queue.put(('configure_failed', None))
             
             # Check abort
             if self.abort_requested:
@@ -528,20 +648,56 @@ class SpectralMeasurementGUI:
             # Perform measurement
             result = self.device.measure(mtype)
             
-            if result is None:
+            if result is None and self.abort_requested:
+                self.measurement_queue.put(('aborted', None))
+            elif result is None:
                 self.measurement_queue.put(('error', 'Measurement failed'))
             else:
                 self.measurement_queue.put(('success', result))
                 
         except Exception as e:
             self.measurement_queue.put(('error', str(e)))
+        
+        finally:
+            # Wake the Tk loop to handle the result
+            self._schedule_drain()
     
-    def _process_queue(self):
-        """Process measurement results from background thread"""
+    def _schedule_drain(self):
+        """Schedule _drain_queue on the Tk loop (safe to call from worker threads)"""
+        try:
+            self.root.after(0, self._drain_queue)
+        except (RuntimeError, tk.TclError):
+            pass  # Main window already closed
+    
+    def _drain_queue(self):
+        """Process measurement, export and device messages from background threads"""
         try:
             while True:
                 status, data = self.measurement_queue.get_nowait()
                 
+                if status == 'status':
+                    self._update_status()
+                    continue
+                elif status == 'configure_failed':
+                    self._last_applied_settings = None
+                    continue
+                elif status == 'device_error':
+                    self._set_status(f"Error: {data}", "red")
+                    continue
+                elif status == 'export_progress':
+                    done, total = data
+                    self.progress.config(value=done)
+                    continue
+                elif status == 'export_done':
+                    self._on_export_finished()
+                    self._last_export_dir = os.path.dirname(data)
+                    messagebox.showinfo("Exported", f"Data exported to:\n{data}")
+                    continue
+                elif status == 'export_error':
+                    self._on_export_finished()
+                    messagebox.showerror("Export Error", data)
+                    continue
+                
                 self.is_measuring = False
                 self._show_progress(False)
                 self.measure_btn.config(state='normal')
@@ -552,12 +708,23 @@ class SpectralMeasurementGUI:
                     self._on_measurement_error(data)
                 elif status == 'aborted':
                     self._set_status("Measurement aborted", "orange")
+                    if self.auto_repeat_active:
+                        self._stop_auto_repeat()
+                
+                # A measurement finished: auto-repeat can schedule the next one
+                if self.auto_repeat_active:
+                    self._schedule_auto_repeat_tick()
                     
         except Empty:
             pass
-        
-        # Schedule next check
-        self.root.after(100, self._process_queue)
+    
+    def _on_export_finished(self):
+        """Reset export state after the export thread is done"""
+        self.is_exporting = False
+        self.measure_btn.config(state='normal')
+        self.start_repeat_btn.config(state='normal')
+        self._show_progress(False)
+        self._set_status("Ready", "green")
     
     def _on_measurement_complete(self, result: MeasurementResult):
         """Handle successful measurement"""
@@ -574,28 +741,106 @@ class SpectralMeasurementGUI:
         if self.auto_repeat_active and self.auto_repeat_waiting_for_measurement:
             # Store the measurement
             self.auto_repeat_measurements.append(result)
+            self._auto_repeat_error_count = 0
             
             # Increment counter
             self.auto_repeat_current_count += 1
             self._update_repeat_progress()
             
-            # Add 1 second stabilization delay before next measurement
+            # Stabilization delay before next measurement
             self.auto_repeat_waiting_for_measurement = False
-            self.auto_repeat_job = self.root.after(1000, self._auto_repeat_cycle)
-            return
+            self._auto_repeat_deadline = time.monotonic() + self._AUTO_REPEAT_SETTLE_S
         
         # Update plot
+        self._request_plot(result)
+    
+    def _request_plot(self, result: MeasurementResult):
+        """Plot a result, redrawing at most _plot_max_hz times per second"""
+        self._pending_plot = result
+        if self._plot_job is not None:
+            return  # A flush is already scheduled and will pick up this result
+        
+        delay = self._last_plot_ts + 1.0 / self._plot_max_hz - time.monotonic()
+        if delay <= 0:
+            self._flush_plot()
+        else:
+            self._plot_job = self.root.after(int(delay * 1000), self._flush_plot)
+    
+    def _flush_plot(self):
+        """Plot the most recent pending result"""
+        self._plot_job = None
+        result = self._pending_plot
+        if result is None or self.plot_window is None:
+            return  # Nothing new, or kept for when the plot window is first shown
+        
+        self._pending_plot = None
+        self._last_plot_ts = time.monotonic()
         self.plot_window.update_spectrum(
             result.wavelengths,
             result.spectral_data,
             result.measurement_type,
-            result.get_summary()
+            result.get_summary(),
+            peak_idx=result.peak_index  # Cached on the result, no second scan
         )
     
     def _on_measurement_error(self, error_message: str):
         """Handle measurement error"""
-        self._set_status(f"Error: {error_message}", "red")
-        messagebox.showerror("Measurement Error", error_message)
+        now = datetime.now()
+        
+        # Count errors in the last 5 seconds (log is in time order)
+        recent = 0
+        for timestamp, _ in reversed(self._error_log):
+            if now - timestamp > timedelta(seconds=5):
+                break
+            recent += 1
+        
+        self._error_log.append((now, error_message))
+        
+        # Never block auto-repeat or stack dialogs for bursts of errors
+        modal = not self.auto_repeat_active and recent < 3
+        self._report_error(error_message, modal)
+        
+        if self.auto_repeat_active:
+            self._auto_repeat_error_count += 1
+            if self._auto_repeat_error_count >= self._MAX_AUTO_REPEAT_ERRORS:
+                # Persistent failure: stop and tell the user once
+                self._stop_auto_repeat()
+                messagebox.showerror(
+                    "Auto-Repeat Stopped",
+                    f"Auto-repeat stopped after {self._MAX_AUTO_REPEAT_ERRORS} "
+                    f"consecutive errors.\n\nLast error: {error_message}")
+                return
+            
+            # Let the next cycle retry instead of waiting forever
+            self.auto_repeat_waiting_for_measurement = False
+            self._auto_repeat_deadline = time.monotonic() + self._AUTO_REPEAT_SETTLE_S
+    
+    def _report_error(self, message: str, modal: bool):
+        """Show an error in the status bar, and in a dialog if modal"""
+        self._set_status(f"Error: {message}", "red")
+        if modal:
+            messagebox.showerror("Measurement Error", message)
+    
+    def _show_error_log(self):
+        """Show recent measurement errors in a window"""
+        window = tk.Toplevel(self.root)
+        window.title("Error Log")
+        window.geometry("600x300")
+        
+        text = tk.Text(window, wrap=tk.WORD, font=('Consolas', 9))
+        scrollbar = ttk.Scrollbar(window, orient=tk.VERTICAL, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        
+        if self._error_log:
+            text.insert('1.0', "\n".join(
+                f"{timestamp.strftime('%H:%M:%S')}  {message}" for timestamp, message in self._error_log
+            ))
+        else:
+            text.insert('1.0', "No errors")
+        text.config(state='disabled')
+        
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
     def _abort_measurement(self):
         """Abort in-progress measurement"""
@@ -606,16 +851,12 @@ class SpectralMeasurementGUI:
     
     def _update_result_display(self, result: MeasurementResult):
         """Update the result text display"""
-        self.result_text.config(state='normal')
-        self.result_text.delete('1.0', tk.END)
-        
         text = result.get_summary()
         text += f"\n\nWavelength Range: {result.wavelength_range[0]:.0f} - {result.wavelength_range[1]:.0f} nm"
         text += f"\nPeak: {result.peak_wavelength:.1f} nm"
         text += f"\nPixels: {result.pixel_count}"
         
-        self.result_text.insert('1.0', text)
-        self.result_text.config(state='disabled')
+        self.result_var.set(text)
     
     # =========================================================================
     # Save / Export Functions
@@ -627,20 +868,10 @@ class SpectralMeasurementGUI:
             messagebox.showwarning("No Data", "No measurement to save")
             return
         
-        label = self.save_label.get() or f"measurement_{len(self.measurement_history) + 1}"
+        label = self.save_label.get() or f"measurement_{len(self.saved_entries) + 1}"
         
-        # Add to history
-        self.measurement_history.append(self.current_result)
-        self.saved_labels.append(label)
-        
-        # Add to treeview
-        result = self.current_result
-        self.data_tree.insert('', 'end', values=(
-            label,
-            result.measurement_type,
-            f"{result.display_value:.4g} {result.display_unit}",
-            result.timestamp.strftime("%H:%M:%S")
-        ))
+        # Add to history and treeview
+        self._add_saved_measurements([(label, self.current_result)])
         
         # Clear label
         self.save_label.set("")
@@ -648,32 +879,123 @@ class SpectralMeasurementGUI:
         
         self._set_status(f"Saved: {label}", "green")
     
+    def _add_saved_measurements(self, entries: List[Tuple[str, MeasurementResult]]):
+        """Append (label, result) pairs to the history and the data tree"""
+        if len(entries) > 1:
+            # Bulk insert: lay the tree out once instead of once per row
+            context = self._suspend_tree_redraw()
+        else:
+            context = nullcontext()
+        
+        with context:
+            for label, result in entries:
+                # CSV row is encoded once here, exports only write the bytes
+                csv_bytes = f"{result.to_csv_row()}\n".encode('utf-8')
+                self.saved_entries.append(SavedEntry(label, result, csv_bytes))
+                self.data_tree.insert('', 'end', values=(
+                    label,
+                    result.measurement_type,
+                    f"{result.display_value:.4g} {result.display_unit}",
+                    result.timestamp.strftime("%H:%M:%S")
+                ))
+    
+    @contextmanager
+    def _suspend_tree_redraw(self):
+        """Unmap the data tree during bulk changes so Tk redraws it once"""
+        self.data_tree.pack_forget()
+        try:
+            yield
+        finally:
+            self.data_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.data_scrollbar)
+    
+    def _import_csv(self):
+        """Import measurements from a CSV file written by Export Data"""
+        filepath = filedialog.askopenfilename(
+            parent=self.root,
+            initialdir=self._last_export_dir,
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not filepath:
+            return
+        self._last_export_dir = os.path.dirname(filepath)
+        
+        try:
+            entries = self._read_measurements_csv(filepath)
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Failed to import measurements:\n{e}")
+            return
+        
+        if not entries:
+            messagebox.showwarning("No Data", "No measurements found in file")
+            return
+        
+        self._add_saved_measurements(entries)
+        self._set_status(f"Imported {len(entries)} measurements", "green")
+    
+    def _read_measurements_csv(self, filepath: str) -> List[Tuple[str, MeasurementResult]]:
+        """
+        Parse an exported measurement CSV into (label, result) pairs.
+        
+        Raises:
+            ValueError: if any line is malformed (the whole file is rejected)
+        """
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        entries = []
+        
+        with open(filepath, 'r') as f:
+            # Header: timestamp,type,luminance,int_time_ms,num_scans,saturation,<wavelengths>
+            header = f.readline().rstrip('\n').split(',')
+            try:
+                wavelengths = np.array(header[6:], dtype=np.float64)
+            except ValueError as e:
+                raise ValueError(f"Invalid wavelength header: {e}") from e
+            if wavelengths.size == 0:
+                raise ValueError("Header has no wavelength columns")
+            
+            for line_no, line in enumerate(f, start=2):
+                fields = line.rstrip('\n').split(',')
+                if len(fields) < 6:
+                    continue
+                
+                # Every row needs one value per header wavelength
+                if len(fields) - 6 != wavelengths.size:
+                    raise ValueError(
+                        f"Line {line_no}: {len(fields) - 6} spectral values, "
+                        f"expected {wavelengths.size}"
+                    )
+                
+                try:
+                    mtype = fields[1]
+                    value = float(fields[2])
+                    result = MeasurementResult(
+                        wavelengths=wavelengths,
+                        spectral_data=np.array(fields[6:], dtype=np.float64),
+                        measurement_type=mtype,
+                        timestamp=datetime.fromisoformat(fields[0]),
+                        luminance=value if mtype in RADIANCE_TYPES else 0.0,
+                        illuminance=value if mtype in IRRADIANCE_TYPES else 0.0,
+                        integration_time_ms=int(float(fields[3])),
+                        num_scans=int(float(fields[4])),
+                        saturation_level=float(fields[5]),
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Line {line_no}: {e}") from e
+                entries.append((f"{stem}_{len(entries) + 1}", result))
+        
+        return entries
+    
     def _export_data(self):
         """Export all data to CSV"""
-        if not self.measurement_history:
+        if not self.saved_entries:
             messagebox.showwarning("No Data", "No measurements to export")
             return
+        if self._export_busy():
+            return
         
-        filepath = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
+        filepath = self._ask_save_csv("Export Data", self._suggest_filename())
         
         if filepath:
-            try:
-                with open(filepath, 'w') as f:
-                    # Write header
-                    f.write(self.measurement_history[0].to_csv_row(include_header=True))
-                    f.write("\n")
-                    
-                    # Write data
-                    for result in self.measurement_history[1:]:
-                        f.write(result.to_csv_row())
-                        f.write("\n")
-                
-                messagebox.showinfo("Exported", f"Data exported to:\n{filepath}")
-            except Exception as e:
-                messagebox.showerror("Export Error", str(e))
+            self._export_data_async(filepath, list(self.saved_entries))
     
     def _export_selected(self):
         """Export selected items"""
@@ -681,25 +1003,100 @@ class SpectralMeasurementGUI:
         if not selection:
             messagebox.showwarning("No Selection", "Please select items to export")
             return
+        if self._export_busy():
+            return
         
         # Get indices of selected items
         indices = [self.data_tree.index(item) for item in selection]
-        selected_results = [self.measurement_history[i] for i in indices]
+        selected_entries = [self.saved_entries[i] for i in indices]
+        
+        filepath = self._ask_save_csv("Export Data", self._suggest_filename())
         
-        filepath = filedialog.asksaveasfilename(
+        if filepath and selected_entries:
+            self._export_data_async(filepath, selected_entries)
+    
+    def _suggest_filename(self, prefix: Optional[str] = None) -> str:
+        """Default export file name: <prefix or device name>_<timestamp>.csv"""
+        if prefix is None:
+            prefix = self.capabilities.device_name.replace(" ", "_")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{prefix}_{timestamp}.csv"
+    
+    def _ask_save_csv(self, title: str, initialfile: str) -> str:
+        """Ask for a CSV file to save to, starting in the last export directory"""
+        return filedialog.asksaveasfilename(
+            parent=self.root,
+            title=title,
+            initialdir=self._last_export_dir,
+            initialfile=initialfile,
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
+    
+    def _export_busy(self) -> bool:
+        """Warn and return True if an export can't start now"""
+        if self.is_exporting:
+            messagebox.showwarning("Busy", "An export is already in progress")
+            return True
+        # Exports and measurements share the progress bar and status line
+        if self.is_measuring or self.auto_repeat_active:
+            messagebox.showwarning("Busy", "Please wait for the measurements to finish")
+            return True
+        return False
+    
+    def _export_data_async(self, filepath: str, entries: List[SavedEntry]):
+        """Write cached CSV rows in a background thread, reporting through the queue"""
+        if self._export_busy():
+            return
+        
+        header = self._csv_header_for(entries[0].result.wavelengths)
+        rows = [entry.csv_bytes for entry in entries]
         
-        if filepath and selected_results:
-            with open(filepath, 'w') as f:
-                f.write(selected_results[0].to_csv_row(include_header=True))
-                f.write("\n")
-                for result in selected_results[1:]:
-                    f.write(result.to_csv_row())
-                    f.write("\n")
+        self.is_exporting = True
+        self.measure_btn.config(state='disabled')
+        self.start_repeat_btn.config(state='disabled')
+        self._show_export_progress(len(rows))
+        self._set_status(f"Exporting {len(rows)} measurements...", "yellow")
+        
+        thread = threading.Thread(
+            target=self._export_thread,
+            args=(filepath, header, rows),
+            daemon=True
+        )
+        thread.start()
+    
+    def _csv_header_for(self, wavelengths: np.ndarray) -> bytes:
+        """Encoded CSV header for a wavelength grid, cached for the device's shared grid"""
+        cached_wavelengths, header = self._csv_header
+        if wavelengths is not cached_wavelengths:
+            header = f"{MeasurementResult.build_csv_header(wavelengths)}\n".encode('utf-8')
+            self._csv_header = (wavelengths, header)
+        return header
+    
+    def _export_thread(self, filepath: str, header: bytes, rows: List[bytes]):
+        """Background thread for CSV export"""
+        total = len(rows)
+        # Write and report progress in about 50 chunks, not once per row
+        step = max(1, total // 50)
+        
+        try:
+            # Large buffer: one syscall per MB instead of one per row
+            with open(filepath, 'wb', buffering=2**20) as f:
+                f.write(header)
+                
+                for start in range(0, total, step):
+                    f.writelines(rows[start:start + step])
+                    done = min(start + step, total)
+                    self.measurement_queue.put(('export_progress', (done, total)))
+                    self._schedule_drain()
             
-            messagebox.showinfo("Exported", f"Selected data exported to:\n{filepath}")
+            self.measurement_queue.put(('export_done', filepath))
+            
+        except Exception as e:
+            self.measurement_queue.put(('export_error', str(e)))
+        
+        finally:
+            self._schedule_drain()
     
     def _delete_selected(self):
         """Delete selected items"""
@@ -711,19 +1108,15 @@ class SpectralMeasurementGUI:
             indices = sorted([self.data_tree.index(item) for item in selection], reverse=True)
             
             for idx in indices:
-                del self.measurement_history[idx]
-                del self.saved_labels[idx]
+                del self.saved_entries[idx]
             
-            for item in selection:
-                self.data_tree.delete(item)
+            self.data_tree.delete(*selection)
     
     def _clear_data(self):
         """Clear all data"""
         if messagebox.askyesno("Confirm Clear", "Delete all saved measurements?"):
-            self.measurement_history.clear()
-            self.saved_labels.clear()
-            for item in self.data_tree.get_children():
-                self.data_tree.delete(item)
+            self.saved_entries.clear()
+            self.data_tree.delete(*self.data_tree.get_children())
     
     # =========================================================================
     # Settings Functions
@@ -731,19 +1124,24 @@ class SpectralMeasurementGUI:
     
     def _apply_settings(self):
         """Apply settings to device"""
-        settings = {name: var.get() for name, var in self.setting_vars.items()}
+        settings = self._current_settings()
         
         if self.device.configure(settings):
+            self._last_applied_settings = dict(settings)
             self._set_status("Settings applied", "green")
         else:
+            self._last_applied_settings = None
             self._set_status("Failed to apply settings", "red")
             messagebox.showerror("Settings Error", "Failed to apply settings to device")
     
+    def _current_settings(self) -> Dict[str, Any]:
+        """Snapshot of the values currently entered in the Settings tab"""
+        return {name: get() for name, get in self._setting_getters}
+    
     def _reset_settings(self):
         """Reset settings to defaults"""
-        for setting in self.capabilities.settings:
-            if setting.name in self.setting_vars:
-                self.setting_vars[setting.name].set(setting.default_value)
+        for var, default in self._setting_defaults:
+            var.set(default)
     
     # =========================================================================
     # Auto-Repeat Functions
@@ -758,6 +1156,10 @@ class SpectralMeasurementGUI:
     
     def _start_auto_repeat(self):
         """Start auto-repeat measurements"""
+        if self.is_exporting:
+            messagebox.showwarning("Busy", "Please wait for the export to finish")
+            return
+        
         # Check if any type is selected
         selected_types = [t for t, v in self.auto_repeat_types.items() if v.get()]
         if not selected_types:
@@ -771,7 +1173,7 @@ class SpectralMeasurementGUI:
             return
         
         # Save current settings snapshot to avoid interference from Settings tab
-        self.auto_repeat_settings = {name: var.get() for name, var in self.setting_vars.items()}
+        self.auto_repeat_settings = self._current_settings()
         
         self.auto_repeat_active = True
         self.auto_repeat_enabled.set(True)
@@ -779,6 +1181,8 @@ class SpectralMeasurementGUI:
         self.auto_repeat_target_count = count
         self.auto_repeat_waiting_for_measurement = False
         self.auto_repeat_measurements = []  # Clear previous measurements
+        self._auto_repeat_error_count = 0
+        self._auto_queue.clear()
         
         self.start_repeat_btn.config(state='disabled')
         self.stop_repeat_btn.config(state='normal')
@@ -786,7 +1190,8 @@ class SpectralMeasurementGUI:
         self.auto_repeat_status.config(text="Active", foreground='green')
         self._update_repeat_progress()
         
-        self._auto_repeat_cycle()
+        self._auto_repeat_deadline = time.monotonic()
+        self._auto_repeat_tick()
     
     def _stop_auto_repeat(self):
         """Stop auto-repeat measurements"""
@@ -802,11 +1207,26 @@ class SpectralMeasurementGUI:
         
         self.auto_repeat_status.config(text="Inactive", foreground='gray')
         self.auto_repeat_progress.config(text="")
+        self._last_progress_text = ''
         self.auto_repeat_current_count = 0
         self.auto_repeat_settings = {}
     
-    def _auto_repeat_cycle(self):
-        """Execute one auto-repeat cycle (count-based)"""
+    def _schedule_auto_repeat_tick(self):
+        """Schedule the next auto-repeat tick at the current deadline"""
+        if self.auto_repeat_job is not None:
+            return  # Already scheduled, don't stack callbacks
+        
+        delay_ms = max(0, int((self._auto_repeat_deadline - time.monotonic()) * 1000))
+        self.auto_repeat_job = self.root.after(delay_ms, self._auto_repeat_tick)
+    
+    def _auto_repeat_tick(self):
+        """
+        Execute one auto-repeat step (count-based).
+        
+        Runs once per measurement: it is scheduled again by _drain_queue
+        when the measurement finishes, so no polling is needed.
+        """
+        self.auto_repeat_job = None
         if not self.auto_repeat_active:
             return
         
@@ -817,20 +1237,20 @@ class SpectralMeasurementGUI:
             self._save_auto_repeat_measurements()
             return
         
-        # If we're waiting for a measurement to complete, check again later
+        # A measurement is running: its completion schedules the next tick
         if self.auto_repeat_waiting_for_measurement or self.is_measuring:
-            self.auto_repeat_job = self.root.after(100, self._auto_repeat_cycle)
             return
         
-        # Start measurement for selected types
-        for mtype, enabled in self.auto_repeat_types.items():
-            if enabled.get():
-                self.auto_repeat_waiting_for_measurement = True
-                self._auto_repeat_measure(mtype)
-                break  # Only measure one type at a time
+        # Measure the selected types in turn, one measurement per tick
+        if not self._auto_queue:
+            self._auto_queue.extend(t for t, v in self.auto_repeat_types.items() if v.get())
+            if not self._auto_queue:
+                # All types were deselected while running
+                self._stop_auto_repeat()
+                return
         
-        # Schedule next check
-        self.auto_repeat_job = self.root.after(100, self._auto_repeat_cycle)
+        self.auto_repeat_waiting_for_measurement = True
+        self._auto_repeat_measure(self._auto_queue.popleft())
     
     def _auto_repeat_measure(self, measurement_type: str):
         """Perform a measurement during auto-repeat with saved settings"""
@@ -845,16 +1265,14 @@ class SpectralMeasurementGUI:
         self._set_status("Auto-measuring...", "yellow")
         
         # Start thread with saved settings snapshot
-        thread = threading.Thread(
-            target=self._measurement_thread,
-            args=(measurement_type, self.auto_repeat_settings),
-            daemon=True
-        )
-        thread.start()
+        self._launch_measurement(measurement_type, self.auto_repeat_settings)
     
     def _update_repeat_progress(self):
-        """Update the progress display for count-based auto-repeat"""
+        """Update the progress display for count-based auto-repeat (skipped when unchanged)"""
         progress_text = f"Progress: {self.auto_repeat_current_count} / {self.auto_repeat_target_count}"
+        if progress_text == self._last_progress_text:
+            return
+        self._last_progress_text = progress_text
         self.auto_repeat_progress.config(text=progress_text)
     
     def _save_auto_repeat_measurements(self):
@@ -863,39 +1281,29 @@ class SpectralMeasurementGUI:
             messagebox.showwarning("No Data", "No measurements were collected")
             return
         
-        # Generate default filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"auto_repeat_{timestamp}.csv"
-        
-        filepath = filedialog.asksaveasfilename(
-            title="Save Auto-Repeat Measurements",
-            defaultextension=".csv",
-            initialfile=default_filename,
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
-        )
+        filepath = self._ask_save_csv("Save Auto-Repeat Measurements",
+                                      self._suggest_filename("auto_repeat"))
         
         if not filepath:
             return
         
         try:
-            with open(filepath, 'w') as f:
-                # Get wavelengths from first measurement (all should have same wavelengths)
-                wavelengths = self.auto_repeat_measurements[0].wavelengths
-                
-                # Write header: Wavelength (nm),Intensity1,Intensity2,...,IntensityX
-                header = "Wavelength (nm)"
-                for i in range(len(self.auto_repeat_measurements)):
-                    header += f",Intensity{i+1}"
-                f.write(header + "\n")
-                
-                # Write data rows
-                for i, wl in enumerate(wavelengths):
-                    row = f"{int(wl)}"
-                    for measurement in self.auto_repeat_measurements:
-                        intensity = measurement.spectral_data[i]
-                        row += f",{intensity:.6e}"
-                    f.write(row + "\n")
+            count = len(self.auto_repeat_measurements)
+            
+            # Get wavelengths from first measurement (all should have same wavelengths)
+            wavelengths = self.auto_repeat_measurements[0].wavelengths
+            
+            # One column per measurement, written in a single pass by numpy
+            table = np.column_stack(
+                [wavelengths] + [m.spectral_data for m in self.auto_repeat_measurements]
+            )
             
+            # Header: Wavelength (nm),Intensity1,Intensity2,...,IntensityX
+            header = ",".join(["Wavelength (nm)"] + [f"Intensity{i+1}" for i in range(count)])
+            np.savetxt(filepath, table, fmt=["%d"] + ["%.6e"] * count,
+                       delimiter=",", header=header, comments="")
+            
+            self._last_export_dir = os.path.dirname(filepath)
             messagebox.showinfo("Auto-Repeat Complete", 
                                f"Completed {self.auto_repeat_target_count} measurements\n\nData saved to:\n{filepath}")
         
@@ -908,46 +1316,59 @@ class SpectralMeasurementGUI:
     
     def _update_status(self):
         """Update status display from device"""
-        status = self.device.status
-        status_text = self.device.get_status_string()
-        
-        colors = {
-            DeviceStatus.DISCONNECTED: 'gray',
-            DeviceStatus.CONNECTING: 'yellow',
-            DeviceStatus.CONNECTED: 'green',
-            DeviceStatus.MEASURING: 'blue',
-            DeviceStatus.ERROR: 'red',
-            DeviceStatus.BUSY: 'orange',
-        }
-        
-        color = colors.get(status, 'gray')
-        self._set_status(status_text, color)
-        
-        # Update device info
+        color = self._STATUS_COLORS.get(self.device.status, 'gray')
+        self._set_status(self.device.get_status_string(), color)
+    
+    def _refresh_device_info(self):
+        """Rebuild the device info text (only needed after a (re)connect)"""
         caps = self.capabilities
-        self.device_info_label.config(text=f"{caps.device_name} | {caps.serial_number or 'No serial'}")
+        text = f"{caps.device_name} | {caps.serial_number or 'No serial'}"
+        if text != self.device_info_label.cget('text'):
+            self.device_info_label.config(text=text)
+    
+    def _ui_refresh(self):
+        """
+        Flush pending redraws before a blocking call on the Tk thread.
+        
+        Only processes idle tasks (geometry and redraw), unlike update()
+        which also runs pending events and callbacks re-entrantly.
+        Use this instead of root.update().
+        """
+        self.root.update_idletasks()
     
     def _set_status(self, message: str, color: str = 'gray'):
         """Set status bar message and color"""
+        if (message, color) == self._last_status:
+            return  # Unchanged, don't touch the widgets
+        self._last_status = (message, color)
         self.status_label.config(text=message)
         self.status_canvas.itemconfig(self.status_indicator, fill=color)
     
     def _show_progress(self, show: bool):
         """Show or hide progress bar"""
         if show:
+            self.progress.config(mode='indeterminate', value=0)
             self.progress_frame.pack(fill=tk.X)
             self.progress.start(10)
         else:
             self.progress.stop()
             self.progress_frame.pack_forget()
     
+    def _show_export_progress(self, total: int):
+        """Show the progress bar in determinate mode for an export of total rows"""
+        self.progress.stop()
+        self.progress.config(mode='determinate', maximum=total, value=0)
+        self.progress_frame.pack(fill=tk.X)
+    
     def _on_device_status_changed(self, status: DeviceStatus):
-        """Callback for device status change"""
-        self.root.after(0, self._update_status)
+        """Callback for device status change (may run on a device thread)"""
+        self.measurement_queue.put(('status', status))
+        self._schedule_drain()
     
     def _on_device_error(self, error_message: str):
-        """Callback for device error"""
-        self.root.after(0, lambda: self._set_status(f"Error: {error_message}", "red"))
+        """Callback for device error (may run on a device thread)"""
+        self.measurement_queue.put(('device_error', error_message))
+        self._schedule_drain()
     
     # =========================================================================
     # Utility Functions
@@ -955,14 +1376,28 @@ class SpectralMeasurementGUI:
     
     def _toggle_plot_window(self):
         """Toggle plot window visibility"""
-        self.plot_window.toggle()
+        self._ensure_plot().toggle()
+    
+    def _ensure_plot(self) -> PlotWindow:
+        """Return the plot window, creating it (hidden) on first use"""
+        if self.plot_window is None:
+            self.plot_window = PlotWindow(self.root, f"Spectrum - {self.capabilities.device_name}")
+            self.plot_window.withdraw()
+            # Show the latest measurement taken before the window existed
+            self._flush_plot()
+        return self.plot_window
     
     def _reconnect_device(self):
         """Reconnect to device"""
         self._set_status("Reconnecting...", "yellow")
+        # connect() blocks the Tk loop: draw the status message first
+        self._ui_refresh()
         self.device.disconnect()
+        # A reconnected device needs its settings applied again
+        self._last_applied_settings = None
         
         if self.device.connect():
+            self._refresh_device_info()
             self._set_status("Connected", "green")
         else:
             self._set_status("Connection failed", "red")
@@ -996,6 +1431,7 @@ F5 / Ctrl+M     Quick Measure
 Ctrl+S          Save Measurement
 Ctrl+P          Toggle Plot Window
 Ctrl+E          Export Data
+Ctrl+Shift+E    Error Log
 Ctrl+Q          Exit
 Escape          Abort Measurement
 
@@ -1025,6 +1461,10 @@ Version: 1.0.0
         # Stop auto-repeat
         self._stop_auto_repeat()
         
+        # Cancel pending plot update
+        if self._plot_job is not None:
+            self.root.after_cancel(self._plot_job)
+        
         # Disconnect device
         try:
             self.device.disconnect()
@@ -1032,7 +1472,8 @@ Version: 1.0.0
             pass
         
         # Close plot window
-        self.plot_window.destroy()
+        if self.plot_window is not None:
+            self.plot_window.destroy()
         
         # Close main window
         self.root.destroy()
@@ -11,16 +11,43 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.lines import Line2D
 import matplotlib.colors as mcolors
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Tuple
 import numpy as np
 import math
+import time
 
+from ..core._kernels import argmax
+from .fast_canvas import FastSpectrumCanvas
 
-def hcl_to_rgb(h: float, c: float, l: float) -> Tuple[float, float, float]:
+
+# sRGB (D65) matrix converting XYZ to linear RGB
+_XYZ_TO_RGB = np.array([
+    [ 3.2404542, -1.5371385, -0.4985314],
+    [-0.9692660,  1.8760108,  0.0415560],
+    [ 0.0556434, -0.2040259,  1.0572252],
+])
+
+# Piecewise wavelength -> HCL mapping following the natural spectrum.
+# Segment k covers [_HCL_EDGES[k], _HCL_EDGES[k+1]) and interpolates linearly
+# with t in [0, 1): hue = h0 + dh*t, chroma = c0 + dc*t, luminance = l0 + dl*t
+_HCL_EDGES = np.array([380, 440, 490, 510, 580, 645, 780], dtype=np.float64)
+_HCL_SEGMENTS = np.array([
+    #  h0,  dh,   c0,  dc,  l0,  dl
+    [285, -25,  60,  40,  30,  25],   # Violet to Blue     (380-440nm)
+    [260, -50, 100,   0,  55,  15],   # Blue to Cyan       (440-490nm)
+    [210, -50, 100, -10,  70,  10],   # Cyan to Green-ish  (490-510nm)
+    [160, -75,  90,  10,  80,  15],   # Green to Yellow    (510-580nm)
+    [ 85, -45, 100,   0,  95, -20],   # Yellow to Orange   (580-645nm)
+    [ 40, -25, 100, -30,  75, -35],   # Orange to Red      (645-780nm)
+], dtype=np.float64)
+
+
+def hcl_to_rgb_vec(h: np.ndarray, c: np.ndarray, l: np.ndarray) -> np.ndarray:
     """
-    Convert HCL (Hue-Chroma-Luminance) to RGB.
+    Convert arrays of HCL (Hue-Chroma-Luminance) values to RGB.
     
     HCL is a perceptually uniform color space based on CIELAB.
     
@@ -30,67 +57,96 @@ def hcl_to_rgb(h: float, c: float, l: float) -> Tuple[float, float, float]:
         l: Luminance [0, 100]
         
     Returns:
-        Tuple of (R, G, B) values in [0, 1] range
+        (N, 3) array of R, G, B values in [0, 1] range
     """
-    # Convert HCL to Lab
-    h_rad = math.radians(h)
-    a = c * math.cos(h_rad)
-    b = c * math.sin(h_rad)
+    h = np.asarray(h, dtype=np.float64)
+    c = np.asarray(c, dtype=np.float64)
+    l = np.asarray(l, dtype=np.float64)
     
-    # Lab to XYZ
-    # D65 illuminant reference values
-    Xn, Yn, Zn = 95.047, 100.0, 108.883
+    # Convert HCL to Lab
+    h_rad = np.radians(h)
+    a = c * np.cos(h_rad)
+    b = c * np.sin(h_rad)
     
+    # Lab to XYZ (D65 illuminant reference values, scaled to [0, 1])
     fy = (l + 16) / 116
-    fx = a / 500 + fy
-    fz = fy - b / 200
+    f = np.stack([a / 500 + fy, fy, fy - b / 200], axis=-1)
     
     delta = 6 / 29
+    xyz = np.where(f > delta, f ** 3, 3 * delta ** 2 * (f - 4 / 29))
+    xyz *= np.array([0.95047, 1.0, 1.08883])
     
-    def f_inv(t):
-        if t > delta:
-            return t ** 3
-        else:
-            return 3 * delta ** 2 * (t - 4 / 29)
+    # XYZ to linear sRGB (D65)
+    rgb = np.einsum('ij,nj->ni', _XYZ_TO_RGB, xyz.reshape(-1, 3))
     
-    X = Xn * f_inv(fx)
-    Y = Yn * f_inv(fy)
-    Z = Zn * f_inv(fz)
+    # Apply sRGB gamma correction (power branch clamped to avoid NaN on negatives)
+    rgb = np.where(
+        rgb <= 0.0031308,
+        12.92 * rgb,
+        1.055 * np.power(np.maximum(rgb, 0.0031308), 1 / 2.4) - 0.055
+    )
     
-    # XYZ to sRGB (D65)
-    X /= 100
-    Y /= 100
-    Z /= 100
+    # Clamp to [0, 1]
+    return np.clip(rgb, 0, 1)
+
+
+def hcl_to_rgb(h: float, c: float, l: float) -> Tuple[float, float, float]:
+    """
+    Convert HCL (Hue-Chroma-Luminance) to RGB.
     
-    R =  3.2404542 * X - 1.5371385 * Y - 0.4985314 * Z
-    G = -0.9692660 * X + 1.8760108 * Y + 0.0415560 * Z
-    B =  0.0556434 * X - 0.2040259 * Y + 1.0572252 * Z
+    Scalar version of hcl_to_rgb_vec().
     
-    # Apply sRGB gamma correction
-    def gamma_correct(c):
-        if c <= 0.0031308:
-            return 12.92 * c
-        else:
-            return 1.055 * (c ** (1 / 2.4)) - 0.055
+    Args:
+        h: Hue in degrees [0, 360)
+        c: Chroma [0, ~100+] (saturation-like)
+        l: Luminance [0, 100]
+        
+    Returns:
+        Tuple of (R, G, B) values in [0, 1] range
+    """
+    r, g, b = hcl_to_rgb_vec(h, c, l)[0]
+    return (float(r), float(g), float(b))
+
+
+def wavelength_to_rgb_vec(wavelengths: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of wavelengths (nm) to RGB colors using HCL color space.
     
-    R = gamma_correct(R)
-    G = gamma_correct(G)
-    B = gamma_correct(B)
+    Maps visible spectrum wavelengths to perceptually uniform HCL colors
+    (hue from ~285° violet to ~15° red), then converts to RGB for display.
+    Wavelengths outside 380-780nm are clamped.
     
-    # Clamp to [0, 1]
-    R = max(0, min(1, R))
-    G = max(0, min(1, G))
-    B = max(0, min(1, B))
+    Args:
+        wavelengths: Wavelengths in nanometers
+        
+    Returns:
+        (N, 3) array of R, G, B values in [0, 1] range
+    """
+    wl = np.clip(np.asarray(wavelengths, dtype=np.float64).ravel(), 380, 780)
+    
+    # Piecewise-linear HCL from the segment table
+    seg = np.searchsorted(_HCL_EDGES[1:-1], wl, side='right')
+    lo = _HCL_EDGES[seg]
+    t = (wl - lo) / (_HCL_EDGES[seg + 1] - lo)
+    h0, dh, c0, dc, l0, dl = _HCL_SEGMENTS[seg].T
+    hue = h0 + dh * t
+    chroma = c0 + dc * t
+    luminance = l0 + dl * t
+    
+    # Apply intensity falloff at edges of visible spectrum
+    intensity = np.where(
+        wl < 420, 0.3 + 0.7 * (wl - 380) / (420 - 380),
+        np.where(wl > 700, 0.3 + 0.7 * (780 - wl) / (780 - 700), 1.0)
+    )
     
-    return (R, G, B)
+    return hcl_to_rgb_vec(hue, chroma * intensity, luminance * intensity)
 
 
 def wavelength_to_rgb(wavelength: float, gamma: float = 0.8) -> Tuple[float, float, float]:
     """
     Convert wavelength (nm) to RGB color using HCL color space.
     
-    Maps visible spectrum wavelengths to perceptually uniform HCL colors,
-    then converts to RGB for display.
+    Scalar version of wavelength_to_rgb_vec().
     
     Args:
         wavelength: Wavelength in nanometers (380-780nm for visible light)
@@ -99,67 +155,40 @@ def wavelength_to_rgb(wavelength: float, gamma: float = 0.8) -> Tuple[float, flo
     Returns:
         Tuple of (R, G, B) values in [0, 1] range
     """
-    wavelength = float(wavelength)
-    
-    # Clamp to visible range
-    if wavelength < 380:
-        wavelength = 380
-    if wavelength > 780:
-        wavelength = 780
-    
-    # Map wavelength to hue (reversed: violet=300°, red=0°)
-    # Visible spectrum: 380nm (violet) -> 780nm (red)
-    # HCL Hue: ~300° (violet/purple) -> ~0° (red)
-    # Using a mapping that follows the natural spectrum
-    
-    if wavelength < 440:
-        # Violet to Blue (380-440nm) -> Hue 285° to 260°
-        t = (wavelength - 380) / (440 - 380)
-        hue = 285 - t * 25
-        chroma = 60 + t * 40  # Increasing chroma
-        luminance = 30 + t * 25  # Increasing luminance
-    elif wavelength < 490:
-        # Blue to Cyan (440-490nm) -> Hue 260° to 210°
-        t = (wavelength - 440) / (490 - 440)
-        hue = 260 - t * 50
-        chroma = 100
-        luminance = 55 + t * 15
-    elif wavelength < 510:
-        # Cyan to Green-ish (490-510nm) -> Hue 210° to 160°
-        t = (wavelength - 490) / (510 - 490)
-        hue = 210 - t * 50
-        chroma = 100 - t * 10
-        luminance = 70 + t * 10
-    elif wavelength < 580:
-        # Green to Yellow (510-580nm) -> Hue 160° to 85°
-        t = (wavelength - 510) / (580 - 510)
-        hue = 160 - t * 75
-        chroma = 90 + t * 10
-        luminance = 80 + t * 15
-    elif wavelength < 645:
-        # Yellow to Orange (580-645nm) -> Hue 85° to 40°
-        t = (wavelength - 580) / (645 - 580)
-        hue = 85 - t * 45
-        chroma = 100
-        luminance = 95 - t * 20
-    else:
-        # Orange to Red (645-780nm) -> Hue 40° to 15°
-        t = (wavelength - 645) / (780 - 645)
-        hue = 40 - t * 25
-        chroma = 100 - t * 30  # Decreasing chroma at far red
-        luminance = 75 - t * 35  # Decreasing luminance at far red
-    
-    # Apply intensity falloff at edges of visible spectrum
-    if wavelength < 420:
-        intensity = 0.3 + 0.7 * (wavelength - 380) / (420 - 380)
-        chroma *= intensity
-        luminance *= intensity
-    elif wavelength > 700:
-        intensity = 0.3 + 0.7 * (780 - wavelength) / (780 - 700)
-        chroma *= intensity
-        luminance *= intensity
-    
-    return hcl_to_rgb(hue, chroma, luminance)
+    r, g, b = wavelength_to_rgb_vec(np.array([wavelength]))[0]
+    return (float(r), float(g), float(b))
+
+
+# RGBA colors of the visible spectrum, one row per nm from 380 to 780 nm
+# (computed once; the spectrum background image always shows all of it)
+_SPECTRUM_LUT_RANGE = (380, 780)
+_SPECTRUM_LUT = np.ones((401, 4), dtype=np.float32)
+_SPECTRUM_LUT[:, :3] = wavelength_to_rgb_vec(np.arange(380, 781))
+
+
+# Colors cycled through by reference overlays
+_OVERLAY_COLORS = ('red', 'green', 'orange', 'purple', 'brown')
+
+
+def _as_array(values) -> np.ndarray:
+    """Spectrum values as an ndarray (no copy if already a float array)"""
+    arr = np.asarray(values)
+    if arr.dtype.kind != 'f':
+        arr = arr.astype(np.float64)
+    return arr
+
+
+def _read_only(arr: np.ndarray) -> np.ndarray:
+    """Read-only view of arr (no copy; writes through the view raise)"""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _span(wavelengths: np.ndarray) -> Tuple[float, float]:
+    """(min, max) of a monotonic wavelength grid, read from its endpoints"""
+    first, last = float(wavelengths[0]), float(wavelengths[-1])
+    return (first, last) if first <= last else (last, first)
 
 
 class PlotWindow(tk.Toplevel):
@@ -189,15 +218,30 @@ class PlotWindow(tk.Toplevel):
         self.spectrum_alpha = 0.3  # Transparency of spectrum background
         
         # Data storage
-        self.current_wavelengths: List[float] = []
-        self.current_data: List[float] = []
+        self.current_wavelengths: np.ndarray = np.empty(0)
+        self.current_data: np.ndarray = np.empty(0)
+        
+        # Pending redraw: update_spectrum only records the latest spectrum,
+        # the drawing happens once per idle cycle in _do_redraw
+        self._pending_labels: Optional[Tuple[str, str]] = None  # (measurement_type, info)
+        self._pending_peak_idx: Optional[int] = None
+        self._redraw_job = None
         self.overlay_spectra: Dict[str, tuple] = {}  # name -> (wavelengths, data, color)
         
         # Plot objects for blitting
         self.main_line = None
-        self.overlay_lines: Dict[str, Any] = {}
+        self._line_wavelengths: Optional[np.ndarray] = None  # x data of main_line
+        self.overlay_collection = None  # All overlays in one LineCollection
+        self.overlay_handles: Dict[str, Line2D] = {}  # name -> legend proxy line
         self.background = None
-        self.spectrum_bars = None  # Spectrum color bars
+        self._last_xlim: Optional[Tuple[float, float]] = None  # xlim of self.background
+        self._saving_figure = False  # True while savefig draws the figure
+        self.spectrum_bars = None  # Spectrum color background (AxesImage)
+        self._mpl_stale = False  # Fast mode skipped matplotlib updates
+        
+        # Mouse coordinates display, updated at most every 50 ms
+        self._last_coord_update = 0.0  # Monotonic time of the last label update
+        self._last_coord_text = ''
         
         # Build UI
         self._create_menu()
@@ -208,7 +252,9 @@ class PlotWindow(tk.Toplevel):
         # Handle close button
         self.protocol("WM_DELETE_WINDOW", self.hide)
         
-        # Bind resize event for background update
+        # Bind resize event for background update (debounced)
+        self._resize_job = None
+        self._last_size: Optional[Tuple[int, int]] = None
         self.bind('<Configure>', self._on_resize)
     
     def _create_menu(self):
@@ -238,6 +284,10 @@ class PlotWindow(tk.Toplevel):
         view_menu.add_checkbutton(label="Show Spectrum Colors", variable=self.spectrum_colors_var, 
                                    command=self._toggle_spectrum_colors)
         
+        self.fast_mode_var = tk.BooleanVar(value=False)
+        view_menu.add_checkbutton(label="Fast Mode", variable=self.fast_mode_var,
+                                   command=self._toggle_fast_mode)
+        
         view_menu.add_separator()
         view_menu.add_command(label="Reset Zoom", command=self.reset_zoom)
         
@@ -247,9 +297,9 @@ class PlotWindow(tk.Toplevel):
         overlay_menu.add_command(label="Save Current as Reference", command=self._save_as_reference)
         overlay_menu.add_command(label="Clear All Overlays", command=self.clear_overlays)
         
-        # Keyboard shortcuts
-        self.bind_all('<Control-e>', lambda e: self.export_image())
-        self.bind_all('<Control-d>', lambda e: self.export_data())
+        # Keyboard shortcuts (window-scoped: the main window has its own Ctrl+E)
+        self.bind('<Control-e>', lambda e: self.export_image())
+        self.bind('<Control-d>', lambda e: self.export_data())
     
     def _create_toolbar(self):
         """Create toolbar with quick actions"""
@@ -288,19 +338,50 @@ class PlotWindow(tk.Toplevel):
         self.ax.set_title('Spectrum', fontsize=12)
         self.ax.grid(True, alpha=0.3)
         
+        # Spectrum color background: one image, refitted by _draw_spectrum_background
+        # (hidden until there is data to plot)
+        self.spectrum_bars = self.ax.imshow(
+            _SPECTRUM_LUT[np.newaxis],
+            aspect='auto',
+            extent=[*_SPECTRUM_LUT_RANGE, 0, 1],
+            origin='lower',
+            alpha=self.spectrum_alpha,
+            visible=False,
+            zorder=0  # Behind everything else
+        )
+        
+        # Overlay spectra: a single artist however many there are, so
+        # blitting costs one draw_artist call (segments set in add_overlay)
+        self.overlay_collection = LineCollection(
+            [], linestyles='--', linewidths=1, alpha=0.7, zorder=2, animated=True
+        )
+        self.ax.add_collection(self.overlay_collection, autolim=False)
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.figure, self)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self._mpl_widget = self.canvas.get_tk_widget()
+        self._mpl_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Add matplotlib navigation toolbar
-        toolbar_frame = ttk.Frame(self)
-        toolbar_frame.pack(fill=tk.X)
-        self.nav_toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        self.nav_toolbar.update()
+        # Matplotlib navigation toolbar, built the first time the mouse
+        # enters its area (it loads many icons and bindings)
+        self.nav_toolbar = None
+        self._toolbar_placeholder = ttk.Frame(self, height=32)
+        self._toolbar_placeholder.pack(fill=tk.X)
+        self._toolbar_placeholder.bind('<Enter>', self._lazy_init_toolbar)
+        
+        # Fast mode display, swapped in place of the matplotlib canvas
+        self.fast_canvas = FastSpectrumCanvas(self)
         
         # Initial draw
         self.canvas.draw()
     
+    def _lazy_init_toolbar(self, event=None):
+        """Create the matplotlib navigation toolbar (once)"""
+        self._toolbar_placeholder.unbind('<Enter>')
+        if self.nav_toolbar is None:
+            self.nav_toolbar = NavigationToolbar2Tk(self.canvas, self._toolbar_placeholder)
+            self.nav_toolbar.update()
+    
     def _create_info_bar(self):
         """Create info bar at bottom"""
         info_frame = ttk.Frame(self)
@@ -314,76 +395,154 @@ class PlotWindow(tk.Toplevel):
         
         # Mouse motion tracking for coordinates
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        
+        # Every full draw refreshes the blitting background
+        self.canvas.mpl_connect('draw_event', self._on_draw)
     
-    def update_spectrum(self, wavelengths: List[float], data: List[float], 
-                        measurement_type: str = "", info: str = ""):
+    def update_spectrum(self, wavelengths: np.ndarray, data: np.ndarray, 
+                        measurement_type: str = "", info: str = "",
+                        peak_idx: Optional[int] = None):
         """
         Update the displayed spectrum.
         
-        Uses blitting for fast updates when possible.
+        The spectrum is drawn when Tk is next idle; if several updates
+        arrive before that, only the latest one is drawn.
         
         Args:
             wavelengths: Wavelength array
             data: Spectral data array
             measurement_type: Type of measurement for labeling
             info: Additional info string to display
+            peak_idx: Index of the spectral maximum, if already known
+                      (saves scanning the data again)
         """
-        self.current_wavelengths = wavelengths
-        self.current_data = data
-        
-        if not wavelengths or not data:
+        self.current_wavelengths = _as_array(wavelengths)
+        self.current_data = _as_array(data)
+        self._pending_labels = (measurement_type, info)
+        self._pending_peak_idx = peak_idx
+        
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Draw the latest spectrum passed to update_spectrum"""
+        self._redraw_job = None
+        measurement_type, info = self._pending_labels
+        wavelengths = self.current_wavelengths
+        data = self.current_data
+        
+        if len(wavelengths) == 0 or len(data) == 0:
             return
         
+        if self.fast_mode_var.get():
+            # Matplotlib is brought up to date when fast mode is left
+            self.fast_canvas.set_spectrum(wavelengths, data)
+            self._mpl_stale = True
+        else:
+            self._draw_matplotlib(wavelengths, data, measurement_type)
+        
+        # Update peak info
+        if len(data):
+            peak_idx = self._pending_peak_idx
+            if peak_idx is None:
+                peak_idx = argmax(data)
+            peak_wl = wavelengths[peak_idx]
+            peak_val = data[peak_idx]
+            self.peak_label.config(text=f"Peak: {peak_wl:.1f}nm @ {peak_val:.3e}")
+        
+        # Update info bar
+        self.info_label.config(text=info if info else f"Points: {len(data)}")
+    
+    def _draw_matplotlib(self, wavelengths: np.ndarray, data: np.ndarray, measurement_type: str):
+        """Draw a spectrum on the matplotlib canvas (blitting when possible)"""
+        self._mpl_stale = False
+        
+        # Axis label (changing it needs a full draw, it is part of the background)
+        y_label = self._get_ylabel(measurement_type)
+        label_changed = y_label != self.ax.get_ylabel()
+        if label_changed:
+            self.ax.set_ylabel(y_label)
+        
         # Update or create main line
         if self.main_line is None:
             # First plot - full draw with spectrum background
-            self.ax.set_xlim(min(wavelengths), max(wavelengths))
-            self._update_ylim()
+            self.ax.set_xlim(*_span(wavelengths))
+            self._update_ylim(force=True)
             self._draw_spectrum_background()  # Draw spectrum colors first (behind)
-            self.main_line, = self.ax.plot(wavelengths, data, 'b-', linewidth=1.5, label='Current', zorder=2)
-            self.canvas.draw()
-            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self.main_line, = self.ax.plot(wavelengths, data, 'b-', linewidth=1.5, label='Current',
+                                           zorder=2, animated=True)
+            self._line_wavelengths = wavelengths
+            self.canvas.draw()  # _on_draw captures the background
+            self._last_xlim = self.ax.get_xlim()
         else:
             # Update with blitting for speed
             try:
-                self.canvas.restore_region(self.background)
-                self.main_line.set_data(wavelengths, data)
+                if wavelengths is self._line_wavelengths:
+                    # Same (shared) wavelength grid as the last spectrum:
+                    # only the y data has to be converted again
+                    self.main_line.set_ydata(data)
+                else:
+                    self.main_line.set_data(wavelengths, data)
+                    self._line_wavelengths = wavelengths
                 
-                if self.autoscale_var.get():
-                    self._update_ylim()
-                    # Redraw spectrum background when ylim changes
+                # Full redraw only when the axes limits actually change
+                # (y outside the hysteresis band, or x zoomed/panned),
+                # otherwise the cached background is still valid
+                ylim_changed = self.autoscale_var.get() and self._update_ylim()
+                if ylim_changed or label_changed or self.ax.get_xlim() != self._last_xlim:
                     self._draw_spectrum_background()
-                    self.canvas.draw()
-                    self.background = self.canvas.copy_from_bbox(self.ax.bbox)
-                
-                self.ax.draw_artist(self.main_line)
-                
-                # Draw overlay lines
-                for line in self.overlay_lines.values():
-                    self.ax.draw_artist(line)
-                
-                self.canvas.blit(self.ax.bbox)
+                    self.canvas.draw()  # _on_draw captures the background
+                    self._last_xlim = self.ax.get_xlim()
+                else:
+                    self._blit_lines()
             except Exception:
                 # Fallback to full redraw
                 self.main_line.set_data(wavelengths, data)
+                self._line_wavelengths = wavelengths
                 if self.autoscale_var.get():
-                    self._update_ylim()
+                    self._update_ylim(force=True)
                 self._draw_spectrum_background()
                 self.canvas.draw_idle()
+    
+    def _sync_matplotlib(self):
+        """Draw the spectrum last shown in fast mode on the matplotlib canvas"""
+        if self._mpl_stale and len(self.current_data):
+            measurement_type = self._pending_labels[0] if self._pending_labels else ""
+            self._draw_matplotlib(self.current_wavelengths, self.current_data, measurement_type)
+    
+    def _animated_artists(self) -> list:
+        """Artists drawn by blitting on top of the cached background"""
+        artists = [self.overlay_collection] if self.overlay_spectra else []
+        if self.main_line is not None:
+            artists.append(self.main_line)
+        return artists
+    
+    def _draw_animated(self):
+        """Draw the animated artists (spectrum lines) into the canvas buffer"""
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+    
+    def _blit_lines(self):
+        """Redraw only the spectrum lines over the cached background"""
+        if self.background is None:
+            self.canvas.draw_idle()  # _on_draw captures the background
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+    
+    def _on_draw(self, event):
+        """
+        After a full draw: capture the background and add the lines.
         
-        # Update labels
-        y_label = self._get_ylabel(measurement_type)
-        self.ax.set_ylabel(y_label)
-        
-        # Update peak info
-        if data:
-            peak_idx = np.argmax(data)
-            peak_wl = wavelengths[peak_idx]
-            peak_val = data[peak_idx]
-            self.peak_label.config(text=f"Peak: {peak_wl:.1f}nm @ {peak_val:.3e}")
-        
-        # Update info bar
-        self.info_label.config(text=info if info else f"Points: {len(data)}")
+        The spectrum lines are animated, so a full draw (resize, zoom,
+        legend, grid...) renders everything except them. The result is
+        exactly the background needed for blitting.
+        """
+        if self._saving_figure:
+            return  # Drawn by savefig, not on screen
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
     
     def _get_ylabel(self, measurement_type: str) -> str:
         """Get appropriate Y-axis label"""
@@ -398,79 +557,121 @@ class PlotWindow(tk.Toplevel):
         }
         return labels.get(measurement_type.lower(), 'Intensity')
     
-    def _update_ylim(self):
-        """Update Y-axis limits based on data"""
-        all_data = list(self.current_data)
-        for _, (_, d, _) in self.overlay_spectra.items():
-            all_data.extend(d)
+    def _update_ylim(self, force: bool = False) -> bool:
+        """
+        Update Y-axis limits based on data.
         
-        if all_data:
-            ymin = min(all_data)
-            ymax = max(all_data)
-            margin = (ymax - ymin) * 0.1 if ymax != ymin else 0.1
-            self.ax.set_ylim(ymin - margin, ymax + margin)
-    
-    def add_overlay(self, name: str, wavelengths: List[float], data: List[float], color: str = 'red'):
-        """Add an overlay spectrum"""
+        Unless force is set, the limits are kept while the data fits
+        inside them and they are no more than 10% of the span away from
+        the ideal limits, so small fluctuations don't trigger a redraw.
+        
+        Returns:
+            True if the limits were changed
+        """
+        # Reduce each spectrum separately, no combined copy of the data
+        ymin, ymax = math.inf, -math.inf
+        for d in (self.current_data, *(d for _, d, _ in self.overlay_spectra.values())):
+            if d.size:
+                ymin = min(ymin, float(d.min()))
+                ymax = max(ymax, float(d.max()))
+        
+        if ymin > ymax:
+            return False  # No data
+        margin = (ymax - ymin) * 0.1 if ymax != ymin else 0.1
+        new_lo, new_hi = ymin - margin, ymax + margin
+        
+        if not force:
+            lo, hi = self.ax.get_ylim()
+            band = (hi - lo) * 0.1
+            if (lo <= ymin and ymax <= hi
+                    and abs(new_lo - lo) <= band and abs(new_hi - hi) <= band):
+                return False
+        
+        self.ax.set_ylim(new_lo, new_hi)
+        return True
+    
+    def add_overlay(self, name: str, wavelengths: np.ndarray, data: np.ndarray, color: str = 'red'):
+        """Add an overlay spectrum (the arrays are kept by reference, not copied)"""
+        wavelengths = _read_only(_as_array(wavelengths))
+        data = _read_only(_as_array(data))
+        previous = self.overlay_spectra.get(name)
         self.overlay_spectra[name] = (wavelengths, data, color)
+        self._update_overlay_collection()
         
-        if name in self.overlay_lines:
-            self.overlay_lines[name].set_data(wavelengths, data)
-        else:
-            line, = self.ax.plot(wavelengths, data, color=color, linestyle='--', 
-                                  linewidth=1, alpha=0.7, label=name)
-            self.overlay_lines[name] = line
+        if previous is not None and mcolors.same_color(previous[2], color):
+            # Same legend entry: the background is still valid, only
+            # the animated lines need to be drawn again
+            self._blit_lines()
+            return
         
-        self.ax.legend(loc='upper right', fontsize=8)
-        self.canvas.draw_idle()
+        self.overlay_handles[name] = Line2D([], [], color=color, linestyle='--',
+                                            linewidth=1, alpha=0.7, label=name)
         
-        # Update background for blitting
-        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        # The legend is part of the background: recapture it with a full draw
+        self._update_legend()
+        self.canvas.draw_idle()
     
     def remove_overlay(self, name: str):
         """Remove an overlay spectrum"""
-        if name in self.overlay_spectra:
-            del self.overlay_spectra[name]
-        
-        if name in self.overlay_lines:
-            self.overlay_lines[name].remove()
-            del self.overlay_lines[name]
+        self.overlay_spectra.pop(name, None)
+        self.overlay_handles.pop(name, None)
+        self._update_overlay_collection()
         
-        self.ax.legend(loc='upper right', fontsize=8)
+        self._update_legend()
         self.canvas.draw_idle()
     
     def clear_overlays(self):
         """Clear all overlay spectra"""
-        for line in self.overlay_lines.values():
-            line.remove()
-        self.overlay_lines.clear()
         self.overlay_spectra.clear()
-        self.ax.legend(loc='upper right', fontsize=8)
+        self.overlay_handles.clear()
+        self._update_overlay_collection()
+        self._update_legend()
         self.canvas.draw_idle()
     
+    def _update_overlay_collection(self):
+        """Rebuild the overlay segments and colors from overlay_spectra"""
+        overlays = self.overlay_spectra.values()
+        self.overlay_collection.set_segments(
+            [np.column_stack([wavelengths, data]) for wavelengths, data, _ in overlays]
+        )
+        self.overlay_collection.set_color([color for _, _, color in overlays])
+    
+    def _update_legend(self):
+        """
+        Rebuild the legend.
+        
+        The overlays are one collection, so their entries come from
+        proxy lines (overlay_handles) rather than from the axes.
+        """
+        handles = list(self.overlay_handles.values())
+        if self.main_line is not None:
+            handles.insert(0, self.main_line)
+        
+        if handles:
+            self.ax.legend(handles=handles, loc='upper right', fontsize=8)
+        elif self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+    
     def _save_as_reference(self):
         """Save current spectrum as reference overlay"""
-        if not self.current_data:
+        if len(self.current_data) == 0:
             messagebox.showwarning("No Data", "No spectrum to save as reference")
             return
         
         name = f"Reference {len(self.overlay_spectra) + 1}"
-        colors = ['red', 'green', 'orange', 'purple', 'brown']
-        color = colors[len(self.overlay_spectra) % len(colors)]
+        color = _OVERLAY_COLORS[len(self.overlay_spectra) % len(_OVERLAY_COLORS)]
         
-        self.add_overlay(name, self.current_wavelengths.copy(), 
-                        self.current_data.copy(), color)
+        # Each update_spectrum call replaces the current arrays rather
+        # than writing into them, so the reference can be shared
+        self.add_overlay(name, self.current_wavelengths, self.current_data, color)
     
     def reset_zoom(self):
         """Reset to full view"""
-        if self.current_wavelengths:
-            self.ax.set_xlim(min(self.current_wavelengths), max(self.current_wavelengths))
-            self._update_ylim()
+        if len(self.current_wavelengths):
+            self.ax.set_xlim(*_span(self.current_wavelengths))
+            self._update_ylim(force=True)
             self._draw_spectrum_background()
         self.canvas.draw_idle()
-        
-        # Update background
-        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
     
     def _zoom_in(self):
         """Zoom in on center"""
@@ -507,44 +708,37 @@ class PlotWindow(tk.Toplevel):
         self._draw_spectrum_background()
         self.canvas.draw_idle()
     
+    def _toggle_fast_mode(self):
+        """Swap between the Tk canvas (fast mode) and the matplotlib canvas"""
+        if self.fast_mode_var.get():
+            self._mpl_widget.pack_forget()
+            self.fast_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5, before=self._toolbar_placeholder)
+            if len(self.current_data):
+                self.fast_canvas.set_spectrum(self.current_wavelengths, self.current_data)
+        else:
+            self.fast_canvas.pack_forget()
+            self._mpl_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5, before=self._toolbar_placeholder)
+            self._sync_matplotlib()
+    
     def _draw_spectrum_background(self):
-        """Draw or remove the visible spectrum color background"""
-        # Remove existing spectrum bars if present
-        if self.spectrum_bars is not None:
-            self.spectrum_bars.remove()
-            self.spectrum_bars = None
-        
+        """Show, hide or refit the visible spectrum color background"""
         if not self.show_spectrum_colors:
+            self.spectrum_bars.set_visible(False)
             return
         
-        # Get current x-axis limits
+        # Nothing to show when zoomed outside the visible spectrum
         xlim = self.ax.get_xlim()
-        ylim = self.ax.get_ylim()
-        
-        # Create colored bars for each wavelength in visible spectrum
-        visible_start = max(380, xlim[0])
-        visible_end = min(780, xlim[1])
-        
-        if visible_start >= visible_end:
+        if max(_SPECTRUM_LUT_RANGE[0], xlim[0]) >= min(_SPECTRUM_LUT_RANGE[1], xlim[1]):
+            self.spectrum_bars.set_visible(False)
             return
         
-        # Generate colors for the visible spectrum as an image
-        num_colors = int(visible_end - visible_start)
-        wavelengths = np.linspace(visible_start, visible_end, num_colors)
-        
-        # Create RGBA array for the spectrum gradient
-        colors = np.array([wavelength_to_rgb(wl) + (self.spectrum_alpha,) for wl in wavelengths])
-        # Reshape to 2D image (1 row, N columns, 4 channels for RGBA)
-        spectrum_image = colors.reshape(1, -1, 4)
-        
-        # Use imshow to display the gradient as background
-        self.spectrum_bars = self.ax.imshow(
-            spectrum_image,
-            aspect='auto',
-            extent=[visible_start, visible_end, ylim[0], ylim[1]],
-            origin='lower',
-            zorder=0  # Behind everything else
-        )
+        # The image always holds the full LUT at a fixed resolution (stable
+        # resampling when zooming); only its height follows the y axis and
+        # the axes clip it to the x limits
+        ylim = self.ax.get_ylim()
+        self.spectrum_bars.set_extent([*_SPECTRUM_LUT_RANGE, ylim[0], ylim[1]])
+        self.spectrum_bars.set_alpha(self.spectrum_alpha)
+        self.spectrum_bars.set_visible(True)
     
     def _change_yscale(self, event=None):
         """Change Y-axis scale (linear/log)"""
@@ -553,15 +747,42 @@ class PlotWindow(tk.Toplevel):
     
     def _on_mouse_move(self, event):
         """Update coordinates display on mouse move"""
-        if event.inaxes == self.ax and event.xdata is not None:
-            self.coords_label.config(text=f"λ={event.xdata:.1f}nm, I={event.ydata:.3e}")
+        if event.inaxes != self.ax or event.xdata is None:
+            return
+        
+        # Mouse events arrive far faster than the label needs refreshing
+        now = time.monotonic()
+        if now - self._last_coord_update < 0.05:
+            return
+        
+        text = f"λ={event.xdata:.1f}nm, I={event.ydata:.3e}"
+        if text == self._last_coord_text:
+            return
+        self._last_coord_update = now
+        self._last_coord_text = text
+        self.coords_label.config(text=text)
     
     def _on_resize(self, event):
-        """Handle window resize - update background for blitting"""
+        """Handle window resize - relayout once the resizing stops"""
+        # Toplevel bindings also see <Configure> of every child widget
+        if event.widget is not self:
+            return
+        
+        size = (event.width, event.height)
+        if size == self._last_size:
+            return  # Moved, not resized
+        self._last_size = size
+        
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(120, self._do_resize_redraw)
+    
+    def _do_resize_redraw(self):
+        """Relayout and redraw after a resize (updates background for blitting)"""
+        self._resize_job = None
         try:
             self.figure.tight_layout()
             self.canvas.draw()
-            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
         except Exception:
             pass
     
@@ -577,12 +798,27 @@ class PlotWindow(tk.Toplevel):
             ]
         )
         if filepath:
-            self.figure.savefig(filepath, dpi=150, bbox_inches='tight')
+            # Fast mode may have left the figure behind the displayed spectrum
+            self._sync_matplotlib()
+            
+            # savefig skips animated artists: include the lines in the file
+            artists = self._animated_artists()
+            for artist in artists:
+                artist.set_animated(False)
+            self._saving_figure = True
+            try:
+                self.figure.savefig(filepath, dpi=150, bbox_inches='tight')
+            finally:
+                self._saving_figure = False
+                for artist in artists:
+                    artist.set_animated(True)
+                # Redraw the screen (and blitting background) at screen dpi
+                self.canvas.draw_idle()
             messagebox.showinfo("Exported", f"Image saved to:\n{filepath}")
     
     def export_data(self):
         """Export spectrum data to CSV"""
-        if not self.current_data:
+        if len(self.current_data) == 0:
             messagebox.showwarning("No Data", "No spectrum data to export")
             return
         
@@ -591,10 +827,9 @@ class PlotWindow(tk.Toplevel):
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if filepath:
-            with open(filepath, 'w') as f:
-                f.write("Wavelength (nm),Intensity\n")
-                for wl, val in zip(self.current_wavelengths, self.current_data):
-                    f.write(f"{wl:.2f},{val:.6e}\n")
+            table = np.column_stack([self.current_wavelengths, self.current_data])
+            np.savetxt(filepath, table, fmt=['%.2f', '%.6e'], delimiter=',',
+                       header="Wavelength (nm),Intensity", comments='')
             messagebox.showinfo("Exported", f"Data saved to:\n{filepath}")
     
     def show(self):
@@ -613,3 +848,13 @@ class PlotWindow(tk.Toplevel):
             self.hide()
         else:
             self.show()
+    
+    def destroy(self):
+        """Destroy the window, cancelling any pending redraws"""
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+            self._resize_job = None
+        super().destroy()
@@ -16,142 +16,237 @@ from tkinter import messagebox
 import argparse
 import sys
 import os
+import threading
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from spectral_gui import SpectralMeasurementGUI, OSpRadDevice
+from spectral_gui import SpectralMeasurementGUI
+from spectral_gui.core import SpectralDevice, DeviceCapabilities, MeasurementType, SettingDefinition
+from spectral_gui.core.device_interface import DeviceStatus
+from spectral_gui.core.measurement_result import MeasurementResult, MeasurementUnit
 
+# Mock spectrum Gaussian peaks: (center nm, amplitude, 1 / (2 * width²))
+_PEAKS = (
+    (550.0, 0.8, 1.0 / (2 * 30 * 30)),  # Main peak (green)
+    (480.0, 0.4, 1.0 / (2 * 20 * 20)),  # Secondary peak (blue)
+    (620.0, 0.6, 1.0 / (2 * 25 * 25)),  # Third peak (red)
+)
 
-def create_mock_device():
+# Mock noise standard deviations
+_SPECTRUM_NOISE_SIGMA = 0.02   # Per spectral sample
+_LUMINANCE_NOISE_SIGMA = 5.0   # On the luminance / illuminance value
+
+# Numba is optional: it only speeds up the mock device spectrum synthesis
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _synth(basis, noise):
+        """Noisy, clipped mock spectrum and its sum in one pass (JIT-compiled)"""
+        data = np.empty_like(basis)
+        total = 0.0
+        for i in range(basis.shape[0]):
+            v = basis[i] + noise[i]
+            if v < 0.0:
+                v = 0.0
+            data[i] = v
+            total += v
+        return data, total
+else:
+    def _synth(basis: np.ndarray, noise: np.ndarray):
+        """Noisy, clipped mock spectrum and its sum"""
+        data = basis + noise
+        np.maximum(data, 0, out=data)
+        return data, float(data.sum())
+
+
+def _mock_capabilities() -> DeviceCapabilities:
     """
-    Create a mock device for testing without hardware.
+    Capabilities of the mock device.
     
-    This demonstrates how easy it is to add a new device type!
+    Built once per MockDevice (not at import, so other devices don't pay
+    for it). DeviceCapabilities is mutable, so instances never share one.
     """
-    from spectral_gui.core import SpectralDevice, DeviceCapabilities, MeasurementType, SettingDefinition
-    from spectral_gui.core.device_interface import DeviceStatus
-    from spectral_gui.core.measurement_result import MeasurementResult, MeasurementUnit
-    from datetime import datetime
-    import math
-    import random
-    
-    class MockDevice(SpectralDevice):
-        """Mock device for testing"""
-        
-        def __init__(self):
-            super().__init__()
-            self._connected = False
-            self.int_time = 100
-            self.num_scans = 10
-        
-        def connect(self) -> bool:
-            self._connected = True
-            self.status = DeviceStatus.CONNECTED
-            return True
-        
-        def disconnect(self):
-            self._connected = False
-            self.status = DeviceStatus.DISCONNECTED
-        
-        def is_connected(self) -> bool:
-            return self._connected
-        
-        def get_capabilities(self) -> DeviceCapabilities:
-            return DeviceCapabilities(
-                device_name="Mock Spectrometer",
-                device_type="Mock",
-                manufacturer="Test",
-                model="MOCK-1000",
-                serial_number="MOCK001",
-                measurement_types=[MeasurementType.RADIANCE, MeasurementType.IRRADIANCE],
-                wavelength_range=(380, 780),
-                pixel_count=401,
-                settings=[
-                    SettingDefinition("integration_time", "Integration Time", "int", 100, 1, 10000, unit="ms"),
-                    SettingDefinition("num_scans", "Number of Scans", "int", 10, 1, 100),
-                ],
-                supports_auto_integration=True,
-            )
+    return DeviceCapabilities(
+        device_name="Mock Spectrometer",
+        device_type="Mock",
+        manufacturer="Test",
+        model="MOCK-1000",
+        serial_number="MOCK001",
+        measurement_types=[MeasurementType.RADIANCE, MeasurementType.IRRADIANCE],
+        wavelength_range=(380, 780),
+        pixel_count=401,
+        settings=[
+            SettingDefinition("integration_time", "Integration Time", "int", 100, 1, 10000, unit="ms"),
+            SettingDefinition("num_scans", "Number of Scans", "int", 10, 1, 100),
+        ],
+        supports_auto_integration=True,
+    )
+
+
+class MockDevice(SpectralDevice):
+    """Mock device for testing"""
+    
+    def __init__(self):
+        super().__init__()
+        self.int_time = 100
+        self.num_scans = 10
+        self._settings = {'integration_time': self.int_time, 'num_scans': self.num_scans}
+        self._capabilities = _mock_capabilities()
+        
+        # One generator for all the mock randomness (noise, timing...)
+        self._rng = np.random.default_rng()
+        
+        # Set by abort_measurement() to cut the simulated delay short
+        self._abort = threading.Event()
+        
+        # Fixed wavelength grid, shared by all results (read-only)
+        self._wavelengths = np.arange(380, 781, dtype=np.float64)
+        self._wavelengths.flags.writeable = False
+        
+        # Noise-free mock spectrum: the peaks never change, only the noise
+        wl = self._wavelengths
+        self._basis = sum(a * np.exp(-(wl - mu) ** 2 * k) for mu, a, k in _PEAKS)
+        self._basis.flags.writeable = False
+    
+    def connect(self) -> bool:
+        _synth(self._basis, np.zeros_like(self._basis))  # Compile (or load) the JIT kernel up front
+        self._connected = True
+        self.status = DeviceStatus.CONNECTED
+        return True
+    
+    def disconnect(self):
+        self._connected = False
+        self.status = DeviceStatus.DISCONNECTED
+    
+    def get_capabilities(self) -> DeviceCapabilities:
+        return self._capabilities
+    
+    def configure(self, settings):
+        if 'integration_time' in settings:
+            self.int_time = settings['integration_time']
+        if 'num_scans' in settings:
+            self.num_scans = settings['num_scans']
+        self._settings = {'integration_time': self.int_time, 'num_scans': self.num_scans}
+        return True
+    
+    def measure(self, measurement_type):
+        self.status = DeviceStatus.MEASURING
+        
+        # All the random numbers for this measurement in two draws:
+        # uniform (delay, saturation) and standard normal (one value per
+        # spectral sample plus one for the luminance, each scaled below)
+        delay_u, saturation_u = self._rng.random(2)
+        noise = self._rng.standard_normal(self._basis.size + 1)
         
-        def configure(self, settings):
-            if 'integration_time' in settings:
-                self.int_time = settings['integration_time']
-            if 'num_scans' in settings:
-                self.num_scans = settings['num_scans']
-            return True
-        
-        def measure(self, measurement_type):
-            import time
-            self.status = DeviceStatus.MEASURING
-            
-            # Simulate measurement delay
-            time.sleep(0.5 + random.random())
-            
-            # Generate mock spectrum (Gaussian peaks)
-            wavelengths = [380 + i for i in range(401)]
-            
-            # Create a realistic-looking spectrum with multiple peaks
-            data = []
-            for wl in wavelengths:
-                # Main peak around 550nm (green)
-                val = 0.8 * math.exp(-0.5 * ((wl - 550) / 30) ** 2)
-                # Secondary peak around 480nm (blue)
-                val += 0.4 * math.exp(-0.5 * ((wl - 480) / 20) ** 2)
-                # Third peak around 620nm (red)
-                val += 0.6 * math.exp(-0.5 * ((wl - 620) / 25) ** 2)
-                # Add some noise
-                val += random.gauss(0, 0.02)
-                data.append(max(0, val))
-            
-            # Calculate mock luminance
-            luminance = sum(data) * 10 + random.gauss(0, 5)
-            
+        # Simulate measurement delay (runs on the GUI's measurement thread;
+        # an abortable wait rather than sleep so Escape takes effect at once).
+        # The event is cleared by prepare_measurement() on the GUI thread,
+        # so an abort requested before this point is not lost
+        if self._abort.wait(0.5 + delay_u):
+            self._abort.clear()  # Consumed by this measurement
             self.status = DeviceStatus.CONNECTED
-            
-            return MeasurementResult(
-                wavelengths=wavelengths,
-                spectral_data=data,
-                measurement_type=measurement_type.value,
-                timestamp=datetime.now(),
-                luminance=luminance if measurement_type == MeasurementType.RADIANCE else 0,
-                illuminance=luminance if measurement_type == MeasurementType.IRRADIANCE else 0,
-                integration_time_ms=self.int_time,
-                num_scans=self.num_scans,
-                saturation_level=random.random() * 0.1,
-                device_name="Mock Spectrometer",
-                device_serial="MOCK001",
-            )
+            return None
+        
+        # Generate mock spectrum (precomputed Gaussian peaks plus noise)
+        data, total = _synth(self._basis, noise[:-1] * _SPECTRUM_NOISE_SIGMA)
+        
+        # Calculate mock luminance (total is summed by _synth while
+        # writing the spectrum, no second pass over the data)
+        luminance = total * 10.0 + noise[-1] * _LUMINANCE_NOISE_SIGMA
         
-        def get_current_settings(self):
-            return {
-                'integration_time': self.int_time,
-                'num_scans': self.num_scans,
-            }
+        self.status = DeviceStatus.CONNECTED
+        
+        return MeasurementResult(
+            wavelengths=self._wavelengths,
+            spectral_data=data,
+            measurement_type=measurement_type.value,
+            timestamp=datetime.now(),
+            luminance=luminance if measurement_type == MeasurementType.RADIANCE else 0,
+            illuminance=luminance if measurement_type == MeasurementType.IRRADIANCE else 0,
+            integration_time_ms=self.int_time,
+            num_scans=self.num_scans,
+            saturation_level=saturation_u * 0.1,
+            device_name="Mock Spectrometer",
+            device_serial="MOCK001",
+        )
     
-    return MockDevice()
+    def get_current_settings(self):
+        return dict(self._settings)
+    
+    def measure_batch(self, n: int):
+        """
+        Generate n synthetic spectra at once (for tests and stress scripts).
+        
+        No simulated delay and no MeasurementResult per spectrum: the
+        spectra are rows of one array built in a single vectorized pass.
+        
+        Returns:
+            (data, luminance): (n, 401) spectra and (n,) luminance values,
+            on the self._wavelengths grid
+        """
+        data = self._rng.normal(0.0, _SPECTRUM_NOISE_SIGMA, (n, self._basis.size))
+        data += self._basis
+        np.maximum(data, 0, out=data)
+        luminance = data.sum(axis=1) * 10.0 + self._rng.normal(0.0, _LUMINANCE_NOISE_SIGMA, n)
+        return data, luminance
+    
+    def prepare_measurement(self) -> None:
+        self._abort.clear()
+    
+    def abort_measurement(self) -> bool:
+        self._abort.set()
+        return True
 
 
-def get_device(device_type: str):
+def create_osprad_device(calibration_file: Optional[str] = None):
+    """Create an OSpRad device (the driver is only imported when needed)"""
+    from spectral_gui.devices import OSpRadDevice
+    if calibration_file is None:
+        return OSpRadDevice()
+    return OSpRadDevice(calibration_file=calibration_file)
+
+
+def create_mock_device():
     """
-    Factory function to create device based on type.
+    Create a mock device for testing without hardware.
     
-    Add your own devices here!
+    This demonstrates how easy it is to add a new device type!
     """
-    devices = {
-        'osprad': lambda: OSpRadDevice(),
-        'mock': create_mock_device,
-        # Add more devices:
-        # 'oceanoptics': lambda: OceanOpticsDevice(),
-        # 'thorlabs': lambda: ThorlabsDevice(),
-        # 'custom': lambda: YourCustomDevice(),
-    }
-    
-    if device_type not in devices:
-        available = ', '.join(devices.keys())
+    return MockDevice()
+
+
+# Device type name -> factory returning a new device.
+# Add your own devices here (or register them from another module with
+# _DEVICE_FACTORIES['name'] = factory)!
+_DEVICE_FACTORIES = {
+    'osprad': create_osprad_device,
+    'mock': create_mock_device,
+    # Add more devices:
+    # 'oceanoptics': lambda: OceanOpticsDevice(),
+    # 'thorlabs': lambda: ThorlabsDevice(),
+    # 'custom': lambda: YourCustomDevice(),
+}
+
+
+def get_device(device_type: str):
+    """Factory function to create device based on type (see _DEVICE_FACTORIES)"""
+    factory = _DEVICE_FACTORIES.get(device_type)
+    if factory is None:
+        available = ', '.join(_DEVICE_FACTORIES)
         raise ValueError(f"Unknown device type: {device_type}. Available: {available}")
     
-    return devices[device_type]()
+    return factory()
 
 
 def main():
@@ -167,12 +262,14 @@ def main():
     # Create root window
     root = tk.Tk()
     
+    # Startup errors are also shown in a dialog (there may be no console);
+    # errors inside the main loop propagate with their own traceback
     try:
         # Create device
         print(f"Initializing device: {args.device}")
         
         if args.device == 'osprad':
-            device = OSpRadDevice(calibration_file=args.calibration)
+            device = create_osprad_device(args.calibration)
         else:
             device = get_device(args.device)
         
@@ -202,12 +299,12 @@ def main():
         print("Starting GUI...")
         app = SpectralMeasurementGUI(root, device)
         
-        # Run main loop
-        root.mainloop()
-        
     except Exception as e:
         messagebox.showerror("Error", f"Application error:\n{e}")
         raise
+    
+    # Run main loop
+    root.mainloop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+#
+#  Numeric Kernel Tests
+#
+#  The JIT-compiled and numpy code paths must return identical results,
+#  so both are exercised here regardless of whether numba is installed.
+#
+
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from spectral_gui.core import _kernels
+
+
+ARGMAX_IMPLEMENTATIONS = [_kernels._argmax_loop, _kernels._argmax_numpy, _kernels.argmax]
+
+ARGMAX_CASES = [
+    np.array([1.0]),
+    np.array([0.0, 3.0, 1.0]),
+    np.array([2.0, 5.0, 5.0, 1.0]),                   # Ties: first maximum wins
+    np.array([-3.0, -1.0, -2.0]),
+    np.array([np.nan, 1.0, 2.0]),                     # Leading NaN
+    np.array([1.0, np.nan, 5.0, np.nan]),             # First NaN wins over larger values
+    np.array([1.0, 2.0, np.nan]),                     # Trailing NaN
+    np.array([np.nan, np.nan]),
+    np.array([-np.inf, np.inf, 1.0]),
+]
+
+
+@pytest.mark.parametrize("values", ARGMAX_CASES, ids=repr)
+@pytest.mark.parametrize("impl", ARGMAX_IMPLEMENTATIONS, ids=lambda f: f.__name__)
+def test_argmax_matches_numpy(impl, values):
+    assert impl(values) == int(np.argmax(values))
+
+
+def test_argmax_random_spectra_agree():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        values = rng.normal(size=64)
+        values[rng.random(64) < 0.05] = np.nan
+        expected = int(np.argmax(values))
+        assert _kernels._argmax_loop(values) == expected
+        assert _kernels.argmax(values) == expected
+
+
+def test_left_riemann_sum():
+    wavelengths = np.array([400.0, 401.0, 403.0, 406.0])
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    # 1*1 + 2*2 + 3*3; the last sample has no interval
+    assert _kernels.left_riemann_sum(wavelengths, values) == pytest.approx(14.0)